@@ -1,3 +1,22 @@
+from typing import BinaryIO, Union
+
+# Each byte value expanded to its four nucleotides, most significant 2-bit
+# pair first: 00 -> 'A', 01 -> 'C', 10 -> 'G', 11 -> 'T'.
+_BYTE_TO_DNA = tuple(
+    "".join("ACGT"[(byte >> shift) & 0b11] for shift in (6, 4, 2, 0))
+    for byte in range(256)
+)
+
+# Number of data bytes produced per write by `encode_base4_to` and
+# `decode_base4_to`.
+STREAM_CHUNK_SIZE = 1 << 16
+
+# `str.translate` tables: nucleotide -> base-4 digit, and deletion of all
+# valid nucleotides (leaving only invalid characters).
+_DNA_TO_BASE4_DIGIT_TABLE = str.maketrans("ACGT", "0123")
+_DELETE_DNA_TABLE = str.maketrans("", "", "ACGT")
+
+
 def encode_base4(data: bytes) -> str:
     """
     Encodes a bytes object into a DNA sequence string using a base-4 representation.
@@ -9,32 +28,51 @@ def encode_base4(data: bytes) -> str:
         A string representing the DNA sequence.
         Returns an empty string if the input data is empty.
     """
-    if not data:
-        return ""
-
-    binary_string = ""
-    for byte in data:
-        # Convert byte to its 8-bit binary representation, padding with leading zeros
-        binary_string += format(byte, '08b')
-
-    dna_sequence = ""
-    for i in range(0, len(binary_string), 2):
-        chunk = binary_string[i:i+2]
-        if chunk == "00":
-            dna_sequence += "A"
-        elif chunk == "01":
-            dna_sequence += "C"
-        elif chunk == "10":
-            dna_sequence += "G"
-        elif chunk == "11":
-            dna_sequence += "T"
-        # It's guaranteed that chunks will be one of these, so no else is needed.
-        # However, if the binary_string length is odd, the last chunk will be a single bit.
-        # The problem description implies that the concatenated 8-bit strings will always
-        # result in an even length string, so each chunk will be 2 bits.
-        # For example, b'H' (01001000) -> 01,00,10,00 -> C,A,G,A
-
-    return dna_sequence
+    # Each byte indexes its precomputed 4-nucleotide string, so the whole
+    # sequence is built with one C-level join. For example,
+    # b'H' (01001000) -> 01,00,10,00 -> "CAGA".
+    return "".join(map(_BYTE_TO_DNA.__getitem__, data))
+
+
+def encode_base4_to(
+    source: Union[bytes, bytearray, memoryview, BinaryIO],
+    destination: BinaryIO,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> int:
+    """
+    Encodes data into a DNA sequence and writes it to a binary stream.
+
+    The input is encoded `chunk_size` bytes at a time, so the full DNA
+    string is never held in memory. The bytes written are identical to
+    `encode_base4(data).encode("ascii")`.
+
+    Args:
+        source: The bytes-like object to encode, or a binary file object
+            to read it from.
+        destination: A binary file object receiving the ASCII DNA sequence.
+        chunk_size: Number of input bytes encoded per write. Must be positive.
+
+    Returns:
+        The number of nucleotides written.
+
+    Raises:
+        ValueError: If `chunk_size` is not positive.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    if hasattr(source, "read"):
+        blocks = iter(lambda: source.read(chunk_size), b"")
+    else:
+        view = memoryview(source)
+        blocks = (view[i:i + chunk_size] for i in range(0, len(view), chunk_size))
+
+    written = 0
+    for block in blocks:
+        dna_block = encode_base4(block).encode("ascii")
+        destination.write(dna_block)
+        written += len(dna_block)
+    return written
 
 
 def decode_base4(dna_sequence: str) -> bytes:
@@ -55,26 +93,65 @@ def decode_base4(dna_sequence: str) -> bytes:
     if not dna_sequence:
         return b""
 
-    binary_string = ""
-    dna_to_binary_map = {
-        'A': "00",
-        'C': "01",
-        'G': "10",
-        'T': "11"
-    }
-
-    for char in dna_sequence:
-        binary_chunk = dna_to_binary_map.get(char)
-        if binary_chunk is None:
-            raise ValueError(f"Invalid character in DNA sequence: {char}")
-        binary_string += binary_chunk
-
-    if len(binary_string) % 8 != 0:
+    # Deleting the valid nucleotides leaves only invalid characters, in order.
+    invalid_chars = dna_sequence.translate(_DELETE_DNA_TABLE)
+    if invalid_chars:
+        raise ValueError(f"Invalid character in DNA sequence: {invalid_chars[0]}")
+
+    # Each nucleotide carries 2 bits, so 4 nucleotides make one byte.
+    if len(dna_sequence) % 4 != 0:
         raise ValueError("Invalid DNA sequence length for byte conversion.")
 
-    byte_values = []
-    for i in range(0, len(binary_string), 8):
-        byte_chunk = binary_string[i:i+8]
-        byte_values.append(int(byte_chunk, 2))
+    # Read the sequence as one base-4 number ('A' -> 0, 'C' -> 1, 'G' -> 2,
+    # 'T' -> 3) and convert it to big-endian bytes in a single C-level pass.
+    base4_digits = dna_sequence.translate(_DNA_TO_BASE4_DIGIT_TABLE)
+    return int(base4_digits, 4).to_bytes(len(dna_sequence) // 4, "big")
+
+
+def decode_base4_to(
+    source: BinaryIO,
+    destination: BinaryIO,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> int:
+    """
+    Decodes an ASCII DNA sequence read from a binary stream into another stream.
+
+    The sequence is decoded `chunk_size` output bytes (4 * `chunk_size`
+    nucleotides) at a time, so neither the full DNA string nor the full
+    decoded data is held in memory. Each chunk is validated exactly as by
+    `decode_base4`; if an error is raised, the bytes decoded before it have
+    already been written.
+
+    Args:
+        source: A binary file object containing the DNA sequence.
+        destination: A binary file object receiving the decoded bytes.
+        chunk_size: Number of bytes decoded per write. Must be positive.
+
+    Returns:
+        The number of bytes written.
+
+    Raises:
+        ValueError: If `chunk_size` is not positive, if the sequence contains
+                    invalid characters, or if its length is not valid for
+                    byte conversion.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    written = 0
+    pending = b""
+    for block in iter(lambda: source.read(4 * chunk_size), b""):
+        # Short reads are carried over so that every decoded piece covers
+        # whole groups of 4 nucleotides.
+        block = pending + block
+        usable_length = len(block) - len(block) % 4
+        pending = block[usable_length:]
+        # latin-1 maps every byte to one character, so non-ASCII bytes reach
+        # `decode_base4` and are reported as invalid characters.
+        decoded = decode_base4(block[:usable_length].decode("latin-1"))
+        destination.write(decoded)
+        written += len(decoded)
 
-    return bytes(byte_values)
+    if pending:
+        decode_base4(pending.decode("latin-1"))  # Raises the validation error.
+    return written
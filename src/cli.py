@@ -12,23 +12,41 @@ import json
 import os
 import re # For parsing header parameters
 import concurrent.futures
-from genecoder.encoders import (
-    encode_base4_direct, decode_base4_direct,
+from typing import List, Optional
+from genecoder.encoders import encode_base4_direct, decode_base4_direct
+from genecoder.gc_constrained_encoder import (
     encode_gc_balanced, decode_gc_balanced, calculate_gc_content,
     get_max_homopolymer_length
 )
-from genecoder.encoders import encode_triple_repeat, decode_triple_repeat # DNA-level FEC
+from genecoder.error_correction import encode_triple_repeat, decode_triple_repeat # DNA-level FEC
 from genecoder.hamming_codec import encode_data_with_hamming, decode_data_with_hamming # Binary-level FEC
-from genecoder.formats import to_fasta, from_fasta
+from genecoder.formats import write_fasta, from_fasta
 from genecoder.huffman_coding import encode_huffman, decode_huffman
 from genecoder.error_detection import PARITY_RULE_GC_EVEN_A_ODD_T # Import parity constant
 
+# Buffer size for input and output files. FASTA output is written one short
+# line at a time, so a large buffer turns thousands of small writes into a
+# few large ones.
+IO_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+def _batch_worker_count(num_tasks: int) -> int:
+    """Returns the number of worker processes to use for a batch of files.
+
+    Args:
+        num_tasks (int): The number of files in the batch.
+
+    Returns:
+        int: One worker per file, capped at the number of available CPUs.
+    """
+    return max(1, min(num_tasks, os.cpu_count() or 1))
+
+
 # --- Helper function for single file encoding ---
 def process_single_encode(input_file_path: str, output_file_path: str, args: argparse.Namespace) -> None:
     """Encodes a single file based on provided arguments."""
     print(f"\nProcessing encode for input: {input_file_path} -> output: {output_file_path}")
     try:
-        with open(input_file_path, 'rb') as f_in:
+        with open(input_file_path, 'rb', buffering=IO_BUFFER_SIZE) as f_in:
             original_input_data = f_in.read() # Store original for metrics
 
         current_input_data = original_input_data
@@ -104,11 +122,10 @@ def process_single_encode(input_file_path: str, output_file_path: str, args: arg
             print(f"Warning for {input_file_path}: Unknown FEC method '{args.fec}'. No DNA-level FEC applied.", file=sys.stderr)
         
         fasta_header = " ".join(fasta_header_parts)
-        fasta_output = to_fasta(final_encoded_dna_sequence, fasta_header, line_width=80)
 
         os.makedirs(os.path.dirname(output_file_path), exist_ok=True)
-        with open(output_file_path, 'w', encoding='utf-8') as f_out:
-            f_out.write(fasta_output)
+        with open(output_file_path, 'w', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f_out:
+            write_fasta(f_out, final_encoded_dna_sequence, fasta_header, line_width=80)
 
         # Metrics based on original_input_data and final_encoded_dna_sequence
         original_size_bytes = len(original_input_data) 
@@ -148,7 +165,7 @@ def process_single_decode(input_file_path: str, output_file_path: str, args: arg
     """Decodes a single file based on provided arguments."""
     print(f"\nProcessing decode for input: {input_file_path} -> output: {output_file_path}")
     try:
-        with open(input_file_path, 'r', encoding='utf-8') as f_in:
+        with open(input_file_path, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f_in:
             file_content_str = f_in.read()
 
         parsed_records = from_fasta(file_content_str)
@@ -258,7 +275,7 @@ def process_single_decode(input_file_path: str, output_file_path: str, args: arg
                 # final_decoded_data remains intermediate_binary_data if Hamming fails critically
         
         os.makedirs(os.path.dirname(output_file_path), exist_ok=True)
-        with open(output_file_path, 'wb') as f_out:
+        with open(output_file_path, 'wb', buffering=IO_BUFFER_SIZE) as f_out:
             f_out.write(final_decoded_data)
         
         print(f"Successfully decoded '{input_file_path}' to '{output_file_path}'.")
@@ -271,8 +288,13 @@ def process_single_decode(input_file_path: str, output_file_path: str, args: arg
         print(f"Error for {input_file_path}: Unexpected error during decoding: {e}", file=sys.stderr)
 
 
-def main() -> None:
-    """Parses command-line arguments and executes the requested GeneCoder command."""
+def main(argv: Optional[List[str]] = None) -> None:
+    """Parses command-line arguments and executes the requested GeneCoder command.
+
+    Args:
+        argv (Optional[List[str]]): The arguments to parse, excluding the
+            program name. Defaults to None, which reads `sys.argv[1:]`.
+    """
     parser = argparse.ArgumentParser(
         description="GeneCoder: Encode and decode data into simulated DNA sequences."
     )
@@ -367,7 +389,7 @@ def main() -> None:
         help='Parity rule used during encoding (default: GC_even_A_odd_T).'
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     num_input_files = len(args.input_files)
 
     if args.command == 'encode':
@@ -396,14 +418,14 @@ def main() -> None:
             tasks.append((input_file_path, output_file_path, args))
 
         if num_input_files > 1:
-            print(f"Starting batch encoding for {num_input_files} files using ThreadPoolExecutor...")
-            # Using max_workers=None lets ThreadPoolExecutor decide, often os.cpu_count() * 5
-            # For I/O bound tasks, more workers can be beneficial.
-            with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, os.cpu_count() + 4)) as executor:
+            print(f"Starting batch encoding for {num_input_files} files using ProcessPoolExecutor...")
+            # Encoding is pure-Python and CPU-bound, so threads would be serialized by
+            # the GIL. Separate processes let each file use its own core.
+            with concurrent.futures.ProcessPoolExecutor(max_workers=_batch_worker_count(len(tasks))) as executor:
                 futures = [executor.submit(process_single_encode, task[0], task[1], task[2]) for task in tasks]
                 for future in concurrent.futures.as_completed(futures):
                     try:
-                        future.result()  # To raise exceptions if any occurred in the thread
+                        future.result()  # To raise exceptions if any occurred in the worker process
                     except Exception as exc:
                         print(f'A file processing task generated an exception: {exc}', file=sys.stderr)
             print("\nBatch encoding finished.")
@@ -438,8 +460,8 @@ def main() -> None:
             tasks.append((input_file_path, output_file_path, args))
         
         if num_input_files > 1:
-            print(f"Starting batch decoding for {num_input_files} files using ThreadPoolExecutor...")
-            with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, os.cpu_count() + 4)) as executor:
+            print(f"Starting batch decoding for {num_input_files} files using ProcessPoolExecutor...")
+            with concurrent.futures.ProcessPoolExecutor(max_workers=_batch_worker_count(len(tasks))) as executor:
                 futures = [executor.submit(process_single_decode, task[0], task[1], task[2]) for task in tasks]
                 for future in concurrent.futures.as_completed(futures):
                     try:
@@ -9,12 +9,12 @@ import re # For parsing header parameters
 import asyncio # For asynchronous operations
 
 # Project module imports
-from genecoder.encoders import (
-    encode_base4_direct, decode_base4_direct,
+from genecoder.encoders import encode_base4_direct, decode_base4_direct
+from genecoder.gc_constrained_encoder import (
     encode_gc_balanced, decode_gc_balanced, calculate_gc_content,
     get_max_homopolymer_length
 )
-from genecoder.encoders import encode_triple_repeat, decode_triple_repeat # FEC functions
+from genecoder.error_correction import encode_triple_repeat, decode_triple_repeat # FEC functions
 from genecoder.huffman_coding import encode_huffman, decode_huffman
 from genecoder.formats import to_fasta, from_fasta
 from genecoder.error_detection import PARITY_RULE_GC_EVEN_A_ODD_T
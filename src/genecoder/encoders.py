@@ -11,13 +11,20 @@ from genecoder.error_detection import (
     strip_and_verify_parity,
     PARITY_RULE_GC_EVEN_A_ODD_T
 )
-from .gc_constrained_encoder import (
-    encode_gc_balanced, 
-    decode_gc_balanced, 
-    calculate_gc_content,
-    get_max_homopolymer_length
-)
-from genecoder.error_correction import encode_triple_repeat, decode_triple_repeat
+
+# Each byte value expanded to its four nucleotides, MSB pair first
+# (00 -> 'A', 01 -> 'T', 10 -> 'C', 11 -> 'G'). Encoding is then a single
+# table lookup per byte, joined in C.
+_BYTE_TO_DNA: List[str] = [
+    "".join("ATCG"[(byte_val >> shift) & 0b11] for shift in (6, 4, 2, 0))
+    for byte_val in range(256)
+]
+
+# Maps each nucleotide to its 2-bit value as a base-4 digit, so that a
+# translated sequence can be parsed with `int(..., 4)`.
+_DNA_TO_BASE4_DIGIT_TABLE = str.maketrans("ATCG", "0123")
+# Deletes all valid nucleotides, leaving only invalid characters (if any).
+_DELETE_DNA_TABLE = str.maketrans("", "", "ATCG")
 
 def encode_base4_direct(
     data: bytes, 
@@ -62,35 +69,9 @@ def encode_base4_direct(
     ValueError: If `add_parity` is True and `k_value` is not positive.
     NotImplementedError: If `add_parity` is True and `parity_rule` is unknown.
   """
-  dna_sequence_parts: list[str] = []
-  # Mapping of 2-bit integers to DNA characters.
-  # 0b00 (0) -> 'A', 0b01 (1) -> 'T', 0b10 (2) -> 'C', 0b11 (3) -> 'G'
-  mapping = { 
-      0: 'A', 1: 'T', 2: 'C', 3: 'G'
-  }
-
-  for byte_val in data:
-    # Process bits from most significant to least significant.
-    # Each byte is split into four 2-bit segments.
-    # Example: byte_val = 0b11001001 (decimal 201)
-    # - (byte_val >> 6) & 0b11 results in 0b11 ('G')
-    # - (byte_val >> 4) & 0b11 results in 0b00 ('A')
-    # - (byte_val >> 2) & 0b11 results in 0b10 ('C')
-    # - (byte_val >> 0) & 0b11 results in 0b01 ('T')
-    # The resulting DNA sequence for this byte is "GACT".
-
-    # Extract the four 2-bit pairs from the byte.
-    pairs = [
-        (byte_val >> 6) & 0b11,  # Most significant 2 bits
-        (byte_val >> 4) & 0b11,
-        (byte_val >> 2) & 0b11,
-        (byte_val >> 0) & 0b11   # Least significant 2 bits
-    ]
-
-    for pair_val in pairs:
-      dna_sequence_parts.append(mapping[pair_val])
-
-  encoded_dna = "".join(dna_sequence_parts)
+  # Each byte indexes its precomputed 4-nucleotide string, e.g. the byte
+  # 0b11001001 (201) -> "GACT".
+  encoded_dna = "".join(map(_BYTE_TO_DNA.__getitem__, data))
 
   if add_parity:
     if k_value <= 0:
@@ -164,8 +145,10 @@ def decode_base4_direct(
         dna_sequence, k_value, parity_rule
     )
 
-  # Input validation for the (potentially stripped) sequence to decode
-  if not all(c in 'ATCG' for c in sequence_to_decode):
+  # Input validation for the (potentially stripped) sequence to decode.
+  # A single `str.translate` pass with no per-character branching: deleting
+  # the valid nucleotides leaves only invalid characters, checked once.
+  if sequence_to_decode.translate(_DELETE_DNA_TABLE):
     raise ValueError(
         "Invalid character in sequence to decode. Only 'A', 'T', 'C', 'G' are allowed."
     )
@@ -174,28 +157,15 @@ def decode_base4_direct(
         "Length of sequence to decode must be a multiple of 4."
     )
 
-  decoded_bytes: list[int] = [] 
-  # Mapping of DNA characters to their 2-bit integer values.
-  # 'A' -> 0b00 (0), 'T' -> 0b01 (1), 'C' -> 0b10 (2), 'G' -> 0b11 (3)
-  reverse_mapping = {
-      'A': 0, 'T': 1, 'C': 2, 'G': 3
-  }
-
-  for i in range(0, len(dna_sequence), 4):
-    chars = dna_sequence[i:i+4] # Get a 4-character block
-    current_byte_val = 0
-    # Convert the 4 DNA characters back into one byte.
-    # Example: chars = "GACT" (G=0b11, A=0b00, C=0b10, T=0b01)
-    # - 'G' (0b11) shifted left by 6 bits: 0b11000000
-    # - 'A' (0b00) shifted left by 4 bits: 0b00000000
-    # - 'C' (0b10) shifted left by 2 bits: 0b00001000
-    # - 'T' (0b01) shifted left by 0 bits: 0b00000001
-    # Resulting byte: 0b11000000 | 0b00000000 | 0b00001000 | 0b00000001 = 0b11001001 (201)
-
-    current_byte_val |= reverse_mapping[chars[0]] << 6 # 1st char is MSB pair
-    current_byte_val |= reverse_mapping[chars[1]] << 4
-    current_byte_val |= reverse_mapping[chars[2]] << 2
-    current_byte_val |= reverse_mapping[chars[3]] << 0 # 4th char is LSB pair
-    decoded_bytes.append(current_byte_val)
-
-  return bytes(decoded_bytes), parity_errors
+  if not sequence_to_decode:
+    return b"", parity_errors
+
+  # Each nucleotide becomes its base-4 digit ('A' -> 0, 'T' -> 1, 'C' -> 2,
+  # 'G' -> 3), so the whole sequence reads as one base-4 number whose
+  # big-endian bytes are the decoded data. Example: "GACT" -> "3021" (base 4)
+  # -> 201 -> b'\xc9'.
+  base4_digits = sequence_to_decode.translate(_DNA_TO_BASE4_DIGIT_TABLE)
+  decoded_bytes = int(base4_digits, 4).to_bytes(len(sequence_to_decode) // 4, "big")
+
+  return decoded_bytes, parity_errors
+
@@ -1,3 +1,8 @@
+# Byte tables for the ASCII majority-vote path: any non-zero byte -> 1, and
+# a 0/1 flag -> an all-zeros/all-ones byte mask.
+_NONZERO_TO_FLAG_TABLE = bytes([0]) + bytes([1]) * 255
+_FLAG_TO_MASK_TABLE = bytes.maketrans(b"\x01", b"\xff")
+
 def encode_triple_repeat(dna_sequence: str) -> str:
     """Encodes a DNA sequence by repeating each nucleotide three times.
 
@@ -7,10 +12,16 @@ def encode_triple_repeat(dna_sequence: str) -> str:
     Returns:
         A new DNA sequence string with each nucleotide tripled (e.g., "AAATTTGGGCC").
     """
-    encoded_parts = []
-    for nucleotide in dna_sequence:
-        encoded_parts.append(nucleotide * 3)
-    return "".join(encoded_parts)
+    if dna_sequence.isascii():
+        # Write the sequence into each of the three interleaved positions
+        # with strided slice assignments, which run in C.
+        data = dna_sequence.encode("ascii")
+        encoded = bytearray(3 * len(data))
+        encoded[0::3] = data
+        encoded[1::3] = data
+        encoded[2::3] = data
+        return encoded.decode("ascii")
+    return "".join([nucleotide * 3 for nucleotide in dna_sequence])
 
 def decode_triple_repeat(dna_sequence: str) -> tuple[str, int, int]:
     """Decodes a triple-repeated DNA sequence, correcting single errors in triplets.
@@ -33,31 +44,89 @@ def decode_triple_repeat(dna_sequence: str) -> tuple[str, int, int]:
     if not dna_sequence: # Handle empty sequence input after length check
         return "", 0, 0
 
+    # Split the triplets into their first, second and third nucleotides.
+    # Strided slicing runs in C, and an error-free sequence is recognised
+    # by two string comparisons.
+    firsts = dna_sequence[0::3]
+    seconds = dna_sequence[1::3]
+    thirds = dna_sequence[2::3]
+    if firsts == seconds == thirds:
+        return firsts, 0, 0
+
+    if dna_sequence.isascii():
+        return _majority_vote_ascii(firsts, seconds, thirds)
+
     decoded_nucleotides = []
     corrected_errors_count = 0
     uncorrectable_errors_count = 0
-    
-    i = 0
-    while i < len(dna_sequence):
-        triplet = dna_sequence[i:i+3]
-        
-        # Count occurrences of each nucleotide in the triplet
-        counts = {}
-        for nucleotide in triplet:
-            counts[nucleotide] = counts.get(nucleotide, 0) + 1
-        
-        if len(counts) == 1: # All three are the same (e.g., "AAA")
-            decoded_nucleotides.append(triplet[0])
-        elif len(counts) == 2: # Two out of three are the same (e.g., "AAG")
+
+    for first, second, third in zip(firsts, seconds, thirds):
+        if first == second:
+            # "AAA" needs no correction; "AAG" has a majority in the first two.
+            if first != third:
+                corrected_errors_count += 1
+            decoded_nucleotides.append(first)
+        elif first == third or second == third: # e.g. "AGA" or "GAA"
             corrected_errors_count += 1
-            for nucleotide, count in counts.items():
-                if count == 2:
-                    decoded_nucleotides.append(nucleotide)
-                    break
+            decoded_nucleotides.append(third)
         else: # All three are different (e.g., "AGC")
             uncorrectable_errors_count += 1
-            decoded_nucleotides.append(triplet[0]) # Decode to the first nucleotide
-            
-        i += 3
-        
+            decoded_nucleotides.append(first) # Decode to the first nucleotide
+
     return "".join(decoded_nucleotides), corrected_errors_count, uncorrectable_errors_count
+
+def _differs_flags(x: int, y: int, length: int) -> int:
+    """Flags the byte positions where two packed ASCII strings differ.
+
+    Args:
+        x: The first string, packed big-endian into an int.
+        y: The second string, packed the same way.
+        length: The number of bytes in each string.
+
+    Returns:
+        An int whose big-endian bytes are 1 where `x` and `y` differ and
+        0 elsewhere.
+    """
+    return int.from_bytes((x ^ y).to_bytes(length, "big").translate(_NONZERO_TO_FLAG_TABLE), "big")
+
+def _majority_vote_ascii(firsts: str, seconds: str, thirds: str) -> tuple[str, int, int]:
+    """Majority-votes ASCII triplets for all positions at once.
+
+    Each of the three nucleotide strings is read as one big integer. The
+    bitwise majority `(a & b) | (a & c) | (b & c)` equals the repeated
+    nucleotide wherever at least two of a triplet agree. Per-position
+    "differs" flags come from XOR-ing the integers and translating every
+    non-zero byte to 1; where all three nucleotides differ, the first one
+    is kept.
+
+    Args:
+        firsts: The first nucleotide of every triplet.
+        seconds: The second nucleotide of every triplet.
+        thirds: The third nucleotide of every triplet.
+
+    Returns:
+        A tuple of the decoded sequence, the number of corrected triplets
+        and the number of uncorrectable triplets, as for
+        `decode_triple_repeat`.
+    """
+    length = len(firsts)
+    a = int.from_bytes(firsts.encode("ascii"), "big")
+    b = int.from_bytes(seconds.encode("ascii"), "big")
+    c = int.from_bytes(thirds.encode("ascii"), "big")
+
+    differs_ab = _differs_flags(a, b, length)
+    differs_ac = _differs_flags(a, c, length)
+    all_differ = (differs_ab & differs_ac & _differs_flags(b, c, length)).to_bytes(length, "big")
+    uncorrectable_errors_count = all_differ.count(1)
+    corrected_errors_count = (
+        (differs_ab | differs_ac).to_bytes(length, "big").count(1) - uncorrectable_errors_count
+    )
+
+    first_mask = int.from_bytes(all_differ.translate(_FLAG_TO_MASK_TABLE), "big")
+    majority = (a & b) | (a & c) | (b & c)
+    decoded = (majority & ~first_mask) | (a & first_mask)
+    return (
+        decoded.to_bytes(length, "big").decode("ascii"),
+        corrected_errors_count,
+        uncorrectable_errors_count,
+    )
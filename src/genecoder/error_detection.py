@@ -12,6 +12,22 @@ PARITY_RULE_GC_EVEN_A_ODD_T = "GC_even_A_odd_T"
    - If (count of 'G' + count of 'C') in a block is odd, parity bit is 'T'.
 """
 
+# Parity nucleotide indexed by the parity of a block's G/C count:
+# even -> 'A', odd -> 'T'.
+_GC_PARITY_NUCLEOTIDES = "AT"
+
+# Byte tables for the strided fast path: G/C -> 1 and every other byte -> 0,
+# then a 0/1 parity flag -> its parity nucleotide.
+_GC_FLAG_TABLE = bytes(1 if byte_val in b"GC" else 0 for byte_val in range(256))
+_PARITY_FLAG_TO_NUCLEOTIDE_TABLE = bytes.maketrans(b"\x00\x01", b"AT")
+
+# Limits of the strided fast path. It performs one C-level pass per block
+# offset, so it pays off only for short blocks and only once there are
+# enough blocks to amortise those passes: measured break-even is at about
+# 2-4 blocks per unit of k_value, so at least 4 are required.
+_MAX_STRIDED_K_VALUE = 64
+_MIN_STRIDED_BLOCKS_PER_K_VALUE = 4
+
 # --- Helper Functions ---
 
 def _calculate_gc_parity(dna_block: str) -> str:
@@ -25,11 +41,55 @@ def _calculate_gc_parity(dna_block: str) -> str:
     Returns:
         str: 'A' if the sum of 'G' and 'C' counts is even, 'T' if odd.
     """
-    gc_count = dna_block.count('G') + dna_block.count('C')
-    if gc_count % 2 == 0:
-        return 'A'  # Even GC count
-    else:
-        return 'T'  # Odd GC count
+    return _GC_PARITY_NUCLEOTIDES[(dna_block.count('G') + dna_block.count('C')) & 1]
+
+def _block_gc_parities(data: bytes, k_value: int) -> bytes:
+    """Calculates the GC parity nucleotide of every block of an ASCII sequence.
+
+    G/C nucleotides are flagged as 1 and all other bytes as 0. Taking every
+    `k_value`-th flag from each block offset gives one column per offset,
+    and XOR-ing the columns as big integers yields the parity of each full
+    block in its own byte. The flags are 0/1, so no bits carry between
+    blocks.
+
+    Args:
+        data (bytes): The ASCII-encoded DNA sequence.
+        k_value (int): The block size. Must be a positive integer.
+
+    Returns:
+        bytes: One parity nucleotide (b'A' or b'T') per block, including a
+        shorter final block if `len(data)` is not a multiple of `k_value`.
+    """
+    num_full_blocks = len(data) // k_value
+    full_length = num_full_blocks * k_value
+    gc_flags = data.translate(_GC_FLAG_TABLE)
+
+    parity_flags = 0
+    for offset in range(k_value):
+        parity_flags ^= int.from_bytes(gc_flags[offset:full_length:k_value], "big")
+    parities = parity_flags.to_bytes(num_full_blocks, "big")
+
+    if full_length < len(data):
+        parities += bytes([gc_flags.count(1, full_length) & 1])
+    return parities.translate(_PARITY_FLAG_TO_NUCLEOTIDE_TABLE)
+
+def _use_strided_path(sequence: str, num_blocks: int, k_value: int) -> bool:
+    """Decides whether the strided fast path beats the per-block loop.
+
+    Args:
+        sequence (str): The sequence to process.
+        num_blocks (int): The number of blocks in `sequence`.
+        k_value (int): The block size.
+
+    Returns:
+        bool: True if `sequence` is ASCII, `k_value` is small and there are
+        enough blocks to amortise the per-offset passes.
+    """
+    return (
+        k_value <= _MAX_STRIDED_K_VALUE
+        and num_blocks >= _MIN_STRIDED_BLOCKS_PER_K_VALUE * k_value
+        and sequence.isascii()
+    )
 
 # --- Main Parity Functions ---
 
@@ -59,20 +119,36 @@ def add_parity_to_sequence(dna_sequence: str, k_value: int, rule: str) -> str:
 
     if not dna_sequence: # If original sequence is empty, return empty
         return ""
-
+    if rule != PARITY_RULE_GC_EVEN_A_ODD_T:
+        raise NotImplementedError(f"Parity rule '{rule}' is not implemented.")
+
+    if _use_strided_path(dna_sequence, len(dna_sequence) // k_value, k_value):
+        # Interleave data and parity with one strided slice assignment per
+        # block offset instead of one string concatenation per block.
+        data = dna_sequence.encode("ascii")
+        parities = _block_gc_parities(data, k_value)
+        num_full_blocks = len(data) // k_value
+        full_length = num_full_blocks * k_value
+        chunk_size = k_value + 1
+        full_output_length = num_full_blocks * chunk_size
+
+        output = bytearray(len(data) + len(parities))
+        for offset in range(k_value):
+            output[offset:full_output_length:chunk_size] = data[offset:full_length:k_value]
+        output[k_value:full_output_length:chunk_size] = parities[:num_full_blocks]
+        output[full_output_length:] = data[full_length:] + parities[num_full_blocks:]
+        return output.decode("ascii")
+
+    # The rule is resolved once, so each block costs two C-level counts and
+    # a string lookup.
+    parity_nucleotides = _GC_PARITY_NUCLEOTIDES
     sequence_with_parity_parts: List[str] = []
-    
     for i in range(0, len(dna_sequence), k_value):
         data_block = dna_sequence[i:i + k_value]
-        parity_nt: str
-        if rule == PARITY_RULE_GC_EVEN_A_ODD_T:
-            parity_nt = _calculate_gc_parity(data_block)
-        else:
-            raise NotImplementedError(f"Parity rule '{rule}' is not implemented.")
-        
         sequence_with_parity_parts.append(data_block)
-        sequence_with_parity_parts.append(parity_nt)
-        
+        sequence_with_parity_parts.append(
+            parity_nucleotides[(data_block.count('G') + data_block.count('C')) & 1]
+        )
     return "".join(sequence_with_parity_parts)
 
 
@@ -106,131 +182,63 @@ def strip_and_verify_parity(
     if not isinstance(k_value, int) or k_value <= 0:
         raise ValueError("k_value must be a positive integer.")
 
-    original_sequence_parts: List[str] = []
-    parity_error_blocks: List[int] = []
-    block_index = 0
-    chunk_size = k_value + 1
+    if not dna_sequence_with_parity:
+        return "", []
+    if rule != PARITY_RULE_GC_EVEN_A_ODD_T:
+        raise NotImplementedError(f"Parity rule '{rule}' is not implemented.")
 
-    # Iterate through the sequence in chunks of (k_value + 1)
-    for i in range(0, len(dna_sequence_with_parity), chunk_size):
-        chunk = dna_sequence_with_parity[i:i + chunk_size]
+    chunk_size = k_value + 1
 
-        if len(chunk) < chunk_size: 
-            # This is a trailing partial block, which should only be data if original
-            # sequence length was not a multiple of k_value.
-            # In our add_parity_to_sequence, every data block gets a parity bit.
-            # So, a partial chunk at the end means the input sequence is malformed
-            # or wasn't correctly generated by add_parity_to_sequence.
-            # For now, assume it's malformed if not a full chunk.
-            # Or, if it's shorter than k_value, it's a final data part without parity.
-            # The current add_parity_to_sequence ensures a parity bit for every block,
-            # even the last one if it's shorter than k_value.
-            # So, len(chunk) should ideally always be chunk_size or it's the very last
-            # partial data block from original that was smaller than k_value.
-            # Re-evaluating: add_parity_to_sequence ensures each block gets a parity bit.
-            # So the total length will always be sum_of (len(data_block_i) + 1).
-            # If len(dna_sequence_with_parity) % chunk_size != 0, it means the last
-            # data_block was shorter than k_value, but it still got a parity bit.
-            # The last chunk would be data_block (len < k) + parity_nt.
-            if len(chunk) > 1 : # It has at least a data char and a parity char
-                data_block = chunk[:-1]
-                read_parity_nt = chunk[-1]
-            elif len(chunk) == 1: # Only one char left, must be a data char from a previous block.
-                                  # This scenario is problematic. Assume data_block must exist.
-                # This case implies a malformed sequence.
-                # For simplicity, if it's not a full data_block + parity, consider it an error or ignore.
-                # Given the problem statement: "Handle the last part of the sequence if it's shorter
-                # than k_value + 1 ... This part should not undergo parity check."
-                # This implies such a part is pure data.
-                # However, our add_parity_to_sequence will always add a parity bit.
-                # So, a chunk shorter than k_value + 1 but > 0 implies a final block
-                # of data (length < k) and its parity bit.
-                data_block = chunk[:-1] # The data part
-                if not data_block: # only a parity bit was left, malformed
-                    # Or, if chunk has only one char, it cannot be data + parity.
-                    # This part of the logic needs to be robust.
-                    # If chunk is "A", it's not data + parity.
-                    # If chunk is "AT", data="A", parity="T".
-                    pass # Handled by the main loop structure if len(chunk) is appropriate
-                
-                # Let's refine the loop to handle the final block correctly.
-                # The loop `range(0, len(dna_sequence_with_parity), chunk_size)`
-                # handles full chunks. Any remaining part is a final, possibly shorter,
-                # data block with its parity bit.
-
-            # The current loop structure means `chunk` is always `k_value+1`
-            # unless it's the very last part of the string.
-            # If len(dna_sequence_with_parity) is not a multiple of (k_value+1),
-            # the last chunk will be shorter.
-            # This last chunk *is* a data block (potentially < k_value) + its parity bit.
-            # Example: k=3. DNA="ATGCATG". Add parity: "ATGA TGCGT G?"
-            # "ATGA" (block "ATG", parity "A")
-            # "TGCG" (block "TGC", parity "G") - Error in my example calc
-            # Let's re-trace: dna_sequence="ATGCATG", k_value=3
-            # Block 1: "ATG", gc=1 (odd), parity='T'. Output: "ATGT"
-            # Block 2: "CAT", gc=1 (odd), parity='T'. Output: "CATT"
-            # Block 3: "G", gc=1 (odd), parity='T'. Output: "GT"
-            # Result: "ATGTCATTGT"
-            # Now strip: chunks of 4.
-            # "ATGT": data="ATG", read_parity="T". Expected for "ATG" is "T". OK.
-            # "CATT": data="CAT", read_parity="T". Expected for "CAT" is "T". OK.
-            # "GT": data="G", read_parity="T". Expected for "G" is "T". OK.
-
-            # So the loop should handle the last partial chunk correctly if its length > 1.
-            # If len(chunk) == 1, it's an error or malformed.
-            # If len(chunk) == 0, loop doesn't run.
-
-            if not chunk: continue # Should not happen if len > 0
-            
-            if len(chunk) <= 1: # Malformed: cannot be data + parity
-                # This could be an error or simply a trailing part not part of parity logic.
-                # Based on "This part should not undergo parity check", if it's not k+1,
-                # it's just data. But our add_parity always adds parity.
-                # For now, let's assume valid inputs are multiples of k+1 or end with
-                # a final (data_block_short + parity_nt)
-                # The current loop handles this by processing what it gets.
-                # If len(chunk) is 1, then chunk[:-1] is empty.
-                # _calculate_gc_parity("") is 'A'.
-                # This seems like it needs a clearer rule for trailing data.
-                # For now, any chunk that isn't empty will be processed.
-                # If len(chunk) == 1, data_block = "", read_parity_nt = chunk[0].
-                # This will likely lead to a parity error if not intended.
-                # The problem says "If there's a trailing partial data block ... append it"
-                # This implies it's *not* processed for parity.
-                # Let's adjust the loop to only process full k+1 chunks for parity.
-                # Any remainder is just appended.
-                # This contradicts `add_parity_to_sequence` which always adds parity.
-                # For consistency, `strip_and_verify_parity` must expect that
-                # *every* data block, even a short final one, has an associated parity bit.
-                # The loop should be:
-                # for i in range(0, len_seq_with_parity - (len_seq_with_parity % chunk_size), chunk_size) for full chunks
-                # then handle remainder.
-                # No, the current loop `for i in range(0, len(dna_sequence_with_parity), chunk_size)`
-                # is fine. The last `chunk` can be shorter.
-                pass # Chunk is shorter than k_value + 1. This chunk is data + parity.
-
-        if not chunk: continue # Should not happen with string slicing unless input is empty
+    if _use_strided_path(
+        dna_sequence_with_parity, len(dna_sequence_with_parity) // chunk_size, k_value
+    ):
+        # Split data and parity nucleotides with one strided slice per block
+        # offset, then compare all parities at once.
+        sequence = dna_sequence_with_parity.encode("ascii")
+        num_full_chunks, tail_length = divmod(len(sequence), chunk_size)
+        full_input_length = num_full_chunks * chunk_size
+        full_data_length = num_full_chunks * k_value
+
+        data = bytearray(full_data_length)
+        for offset in range(k_value):
+            data[offset::k_value] = sequence[offset:full_input_length:chunk_size]
+        read_parities = sequence[k_value:full_input_length:chunk_size]
+        if tail_length:
+            data += sequence[full_input_length:-1]
+            read_parities += sequence[-1:]
+
+        expected_parities = _block_gc_parities(data, k_value)
+        if tail_length == 1:
+            expected_parities += b"A"  # Empty final data block.
+
+        parity_error_blocks: List[int] = []
+        if read_parities != expected_parities:
+            parity_error_blocks = [
+                block_index
+                for block_index, (read_nt, expected_nt) in enumerate(
+                    zip(read_parities, expected_parities)
+                )
+                if read_nt != expected_nt
+            ]
+        return data.decode("ascii"), parity_error_blocks
 
+    original_sequence_parts: List[str] = []
+    parity_error_blocks = []
+    parity_nucleotides = _GC_PARITY_NUCLEOTIDES
+
+    # Every chunk is a data block followed by its parity nucleotide.
+    # `add_parity_to_sequence` gives a short final data block its own parity
+    # nucleotide, so the last chunk may be shorter than `chunk_size`. A
+    # trailing chunk of one character has an empty data block, whose
+    # expected parity is 'A'.
+    for block_index, i in enumerate(range(0, len(dna_sequence_with_parity), chunk_size)):
+        chunk = dna_sequence_with_parity[i:i + chunk_size]
         data_block = chunk[:-1]
-        read_parity_nt = chunk[-1]
-
-        if not data_block and not read_parity_nt: # Both empty, if chunk was empty
-             continue
-        if not read_parity_nt and data_block: # Only data, no parity bit, malformed
-            raise ValueError(f"Malformed chunk at index {i}: missing parity bit for data '{data_block}'.")
-        # If data_block is empty but read_parity_nt exists (chunk of length 1):
-        # This means the original data block was empty, which is fine. Parity for "" is 'A'.
-
-        expected_parity_nt: str
-        if rule == PARITY_RULE_GC_EVEN_A_ODD_T:
-            expected_parity_nt = _calculate_gc_parity(data_block)
-        else:
-            raise NotImplementedError(f"Parity rule '{rule}' is not implemented.")
-        
-        if read_parity_nt != expected_parity_nt:
+        expected_parity_nt = parity_nucleotides[
+            (data_block.count('G') + data_block.count('C')) & 1
+        ]
+        if chunk[-1] != expected_parity_nt:
             parity_error_blocks.append(block_index)
-            
         original_sequence_parts.append(data_block)
-        block_index += 1
-        
+
     return "".join(original_sequence_parts), parity_error_blocks
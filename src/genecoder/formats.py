@@ -5,7 +5,30 @@ sequences, where nucleotides or amino acids are represented using single-letter
 codes. A sequence in FASTA format consists of a single-line description (header),
 followed by lines of sequence data.
 """
-from typing import List, Tuple # For type hints
+from typing import Iterator, List, TextIO, Tuple # For type hints
+
+def _fasta_lines(dna_sequence: str, header: str, line_width: int) -> Iterator[str]:
+    """Yields the newline-terminated lines of a FASTA record.
+
+    Args:
+        dna_sequence (str): The DNA sequence string.
+        header (str): The header string, without the leading ">".
+        line_width (int): The maximum number of sequence characters per line.
+
+    Yields:
+        str: The header line, then each sequence line of at most
+        `line_width` characters, each ending in a newline.
+
+    Raises:
+        ValueError: If `line_width` is not a positive integer.
+    """
+    if not isinstance(line_width, int) or line_width <= 0:
+        raise ValueError("line_width must be a positive integer.")
+
+    yield f">{header}\n"
+    for i in range(0, len(dna_sequence), line_width):
+        yield dna_sequence[i:i+line_width] + "\n"
+
 
 def to_fasta(dna_sequence: str, header: str, line_width: int = 60) -> str:
     """Formats a DNA sequence into a FASTA formatted string.
@@ -26,18 +49,32 @@ def to_fasta(dna_sequence: str, header: str, line_width: int = 60) -> str:
     Raises:
         ValueError: If `line_width` is not a positive integer.
     """
-    if not isinstance(line_width, int) or line_width <= 0:
-        raise ValueError("line_width must be a positive integer.")
+    # Join the lines once rather than growing a string line by line, which
+    # copies everything written so far on each append.
+    return "".join(_fasta_lines(dna_sequence, header, line_width))
 
-    fasta_string = f">{header}\n"
-    
-    if not dna_sequence: # Handle empty sequence explicitly for clarity
-        return fasta_string
 
-    for i in range(0, len(dna_sequence), line_width):
-        fasta_string += dna_sequence[i:i+line_width] + "\n"
-        
-    return fasta_string
+def write_fasta(
+    file_obj: TextIO, dna_sequence: str, header: str, line_width: int = 60
+) -> None:
+    """Writes a DNA sequence to an open text file in FASTA format.
+
+    Produces the same output as `to_fasta`, but hands the lines to the file
+    as they are generated instead of first building the whole record as one
+    string.
+
+    Args:
+        file_obj (TextIO): A file object opened for writing in text mode.
+        dna_sequence (str): The DNA sequence string (e.g., "ATGC...").
+        header (str): The header string for the FASTA sequence, which will be
+            prefixed with ">". Do not include ">" in this argument.
+        line_width (int): The maximum number of characters per line for the
+            sequence data. Defaults to 60. Must be a positive integer.
+
+    Raises:
+        ValueError: If `line_width` is not a positive integer.
+    """
+    file_obj.writelines(_fasta_lines(dna_sequence, header, line_width))
 
 
 def from_fasta(fasta_content: str) -> List[Tuple[str, str]]:
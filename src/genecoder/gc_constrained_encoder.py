@@ -1,4 +1,6 @@
+from itertools import groupby
 from typing import Optional
+
 from genecoder.encoders import encode_base4_direct, decode_base4_direct
 
 def calculate_gc_content(dna_sequence: str) -> float:
@@ -98,27 +100,10 @@ def get_max_homopolymer_length(dna_sequence: str) -> int:
     Returns:
         The length of the longest homopolymer. Returns 0 for an empty sequence.
     """
-    if not dna_sequence:
-        return 0
-
-    max_len = 0
-    current_len = 0
-    if len(dna_sequence) > 0:
-        current_char = dna_sequence[0]
-        current_len = 1
-        max_len = 1
-
-    for i in range(1, len(dna_sequence)):
-        if dna_sequence[i] == current_char:
-            current_len += 1
-        else:
-            current_char = dna_sequence[i]
-            current_len = 1
-        
-        if current_len > max_len:
-            max_len = current_len
-            
-    return max_len if dna_sequence else 0
+    # `groupby` splits the sequence into runs of identical characters in C;
+    # materializing each run with `list` measured faster than both a regex
+    # scan and counting with a generator.
+    return max((len(list(run)) for _, run in groupby(dna_sequence)), default=0)
 
 
 def decode_gc_balanced(
@@ -173,3 +158,4 @@ def decode_gc_balanced(
         raise ValueError(f"Invalid signal bit: '{signal_bit}'. Expected '0' or '1'.")
 
     return decoded_data
+
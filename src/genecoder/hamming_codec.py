@@ -128,6 +128,19 @@ def decode_hamming_7_4_codeword(codeword: int) -> tuple[int, bool]:
     return decoded_nibble, error_corrected_flag
 
 
+# Lookup tables built once at import from the codeword functions above: the
+# 7-bit codeword (as a bit string) for each of the 16 nibbles, and the
+# `(decoded_nibble, error_corrected_flag)` result for each of the 128 possible
+# received codewords. The data-level functions below then do one table lookup
+# per nibble or codeword instead of recomputing parity and syndrome bits.
+_NIBBLE_TO_CODEWORD_BITS: list[str] = [
+    format(encode_hamming_7_4_nibble(nibble), '07b') for nibble in range(16)
+]
+_CODEWORD_TO_DECODED: list[tuple[int, bool]] = [
+    decode_hamming_7_4_codeword(codeword) for codeword in range(128)
+]
+
+
 # --- Byte-level and data-level Hamming coding functions ---
 
 def bytes_to_nibbles(data: bytes) -> list[int]:
@@ -203,18 +216,13 @@ def encode_data_with_hamming(data: bytes) -> tuple[bytes, int]:
                                        end of the bit string before byte conversion.
     """
     nibbles = bytes_to_nibbles(data)
-    
-    codewords_7bit: list[int] = []
-    for nibble in nibbles:
-        codewords_7bit.append(encode_hamming_7_4_nibble(nibble))
 
-    if not codewords_7bit: # Handle empty input data
+    if not nibbles: # Handle empty input data
         return b'', 0
 
-    # Bit Packing
-    bit_string = ""
-    for codeword in codewords_7bit:
-        bit_string += format(codeword, '07b') # Convert 7-bit codeword to binary string
+    # Bit Packing: look up each nibble's precomputed 7-bit codeword string and
+    # join them once, rather than growing a string one codeword at a time.
+    bit_string = "".join(map(_NIBBLE_TO_CODEWORD_BITS.__getitem__, nibbles))
 
     num_total_bits = len(bit_string)
     num_padding_bits_at_end = (8 - (num_total_bits % 8)) % 8
@@ -262,9 +270,7 @@ def decode_data_with_hamming(encoded_data: bytes, num_final_padding_bits: int) -
     if not (0 <= num_final_padding_bits < 8):
         raise ValueError("num_final_padding_bits must be between 0 and 7.")
 
-    bit_string = ""
-    for byte_val in encoded_data:
-        bit_string += format(byte_val, '08b')
+    bit_string = "".join(format(byte_val, '08b') for byte_val in encoded_data)
 
     if num_final_padding_bits > 0:
         bit_string = bit_string[:-num_final_padding_bits]
@@ -276,16 +282,12 @@ def decode_data_with_hamming(encoded_data: bytes, num_final_padding_bits: int) -
     if not bit_string: # Handle case where bit_string becomes empty after padding removal
         return b'', 0
 
-    codewords_7bit_str: list[str] = []
-    for i in range(0, len(bit_string), 7):
-        codewords_7bit_str.append(bit_string[i:i+7])
-
     decoded_nibbles: list[int] = []
     corrected_errors_count = 0
     
-    for codeword_str in codewords_7bit_str:
-        codeword_int = int(codeword_str, 2)
-        nibble, corrected = decode_hamming_7_4_codeword(codeword_int)
+    for i in range(0, len(bit_string), 7):
+        # Every 7-bit value has a precomputed (nibble, corrected) entry.
+        nibble, corrected = _CODEWORD_TO_DECODED[int(bit_string[i:i+7], 2)]
         decoded_nibbles.append(nibble)
         if corrected:
             corrected_errors_count += 1
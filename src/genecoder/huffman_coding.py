@@ -10,16 +10,45 @@ This module provides functions to:
 5.  Optionally, add and check parity bits for basic error detection with Huffman-encoded sequences.
 """
 import collections
+import functools
 import heapq
-from typing import Dict, Tuple, List, Union # For type hints
+from typing import Dict, FrozenSet, Optional, Tuple, List, Union # For type hints
 from genecoder.error_detection import (
     add_parity_to_sequence, 
     strip_and_verify_parity, 
     PARITY_RULE_GC_EVEN_A_ODD_T
 )
 
-# Type alias for Huffman tree nodes used internally
-HuffmanNode = Union[int, List[Union[int, 'HuffmanNode', List['HuffmanNode']]]] # type: ignore
+# Type alias for Huffman tree nodes used internally: a leaf holds its byte
+# value, an internal node holds the indices of its (left, right) children.
+HuffmanNode = Union[int, Tuple[int, int]]
+
+# Bits reserved below the frequency in packed heap entries for the node index.
+_HEAP_ID_BITS = 32
+_HEAP_ID_MASK = (1 << _HEAP_ID_BITS) - 1
+
+# 2-bit pair -> nucleotide mapping shared by encoding and decoding.
+_BITS_TO_DNA = {"00": 'A', "01": 'T', "10": 'C', "11": 'G'}
+
+# Each byte value expanded to its four nucleotides, MSB pair first. Used to
+# map whole bytes of the packed bit stream to DNA in one lookup.
+_BYTE_TO_DNA: List[str] = [
+    "".join(_BITS_TO_DNA[bits[i:i + 2]] for i in range(0, 8, 2))
+    for bits in (format(byte_val, '08b') for byte_val in range(256))
+]
+
+# `str.translate` tables: nucleotide -> 2-bit string, and deletion of all
+# valid nucleotides (leaving only invalid characters).
+_DNA_TO_BITS_TABLE = str.maketrans({nt: bits for bits, nt in _BITS_TO_DNA.items()})
+_DELETE_DNA_TABLE = str.maketrans('', '', 'ATCG')
+
+# Number of input bytes whose codes are packed into DNA per block.
+_ENCODE_BLOCK_SIZE = 4096
+
+# Maximum number of bits indexed by the decoder's root lookup table. Codes up
+# to this length decode with one table lookup; longer codes fall back to
+# dictionary lookups by code length.
+_DECODE_LUT_MAX_BITS = 10
 
 # --- Helper Functions ---
 
@@ -37,6 +66,40 @@ def _calculate_frequencies(data: bytes) -> collections.Counter:
         return collections.Counter()
     return collections.Counter(data)
 
+def _generate_codes_from_tree(nodes: List[HuffmanNode], root_index: int) -> Dict[int, Tuple[int, int]]:
+    """Traverses a Huffman tree and generates the code for each leaf.
+
+    The traversal uses an explicit stack instead of recursion, and codes are
+    accumulated as integers rather than by string concatenation. Left
+    children append a `0` bit and right children a `1` bit.
+
+    Args:
+        nodes (List[HuffmanNode]): The tree's nodes. A leaf is an int (the
+            byte value) and an internal node is a `(left_index, right_index)`
+            tuple of indices into `nodes`.
+        root_index (int): The index of the root node in `nodes`.
+
+    Returns:
+        Dict[int, Tuple[int, int]]: A dictionary mapping each byte value to a
+        `(code_int, code_len)` pair, where `code_int` holds the code bits
+        (MSB first) and `code_len` is the number of bits. A root that is
+        itself a leaf gets the 1-bit code `0`.
+    """
+    codes: Dict[int, Tuple[int, int]] = {}
+    stack: List[Tuple[int, int, int]] = [(root_index, 0, 0)]
+    while stack:
+        node_index, code_int, code_len = stack.pop()
+        node = nodes[node_index]
+        if isinstance(node, int):  # Leaf node (byte value)
+            codes[node] = (code_int, code_len if code_len else 1)
+            continue
+        # Internal node: (left_index, right_index). The right child is pushed
+        # first so the left subtree is visited first, as in a pre-order walk.
+        left_index, right_index = node
+        stack.append((right_index, (code_int << 1) | 1, code_len + 1))
+        stack.append((left_index, code_int << 1, code_len + 1))
+    return codes
+
 def _build_huffman_tree_and_codes(frequencies: collections.Counter) -> Dict[int, str]:
     """Builds a Huffman tree from byte frequencies and generates Huffman codes.
 
@@ -52,84 +115,217 @@ def _build_huffman_tree_and_codes(frequencies: collections.Counter) -> Dict[int,
     if not frequencies:
         return {}
 
-    # Use a unique ID from a counter to ensure stable sorting in heapq for
-    # nodes that might have the same frequency. This makes tree construction
-    # deterministic for tie-breaking.
-    unique_id_counter = 0
-    
-    # The heap stores tuples: (frequency, unique_id, node).
-    # 'node' is an int for leaf nodes (representing the byte value) or a 
-    # list [left_child, right_child] for internal nodes.
-    heap: List[Tuple[int, int, HuffmanNode]] = []
-    for byte_val, freq in frequencies.items():
-        heapq.heappush(heap, (freq, unique_id_counter, byte_val))
-        unique_id_counter += 1
-
     # Edge case: If there's only one unique byte in the input data.
     # The Huffman code for this single byte is defined as '0'.
-    if len(heap) == 1:
-        _freq, _uid, byte_val = heap[0]
-        # Ensure byte_val is an int, as expected by type hints, not a list.
-        if isinstance(byte_val, int):
-            return {byte_val: '0'}
-        else:
-            # This case should ideally not be reached if frequencies are from bytes.
-            # However, for robustness, handle potential malformed heap item.
-            raise ValueError("Malformed heap item for single unique byte.")
-
+    if len(frequencies) == 1:
+        return {next(iter(frequencies)): '0'}
+
+    # Tree nodes live in `nodes`, and a node's index doubles as its unique ID
+    # for tie-breaking, which makes tree construction deterministic. Leaves
+    # are byte values (int); internal nodes are (left_index, right_index).
+    #
+    # Each heap entry packs a node's frequency and index into a single int,
+    # `freq << _HEAP_ID_BITS | index`, so heap comparisons are plain integer
+    # compares ordering by frequency first and index second.
+    nodes: List[HuffmanNode] = list(frequencies)
+    heap: List[int] = [
+        (freq << _HEAP_ID_BITS) | index
+        for index, freq in enumerate(frequencies.values())
+    ]
+    heapq.heapify(heap)
 
     # Build the Huffman tree by repeatedly combining the two lowest-frequency nodes.
     while len(heap) > 1:
-        freq1, uid1, left_node = heapq.heappop(heap)
-        freq2, uid2, right_node = heapq.heappop(heap)
-
-        new_freq = freq1 + freq2
-        # Internal nodes are represented as a list: [left_child, right_child]
-        internal_node: HuffmanNode = [left_node, right_node] 
-        
-        heapq.heappush(heap, (new_freq, unique_id_counter, internal_node))
-        unique_id_counter += 1
-    
-    # The last remaining item on the heap is the root of the Huffman tree.
-    # heap[0][2] directly accesses the node part of the tuple.
-    root_node_wrapper = heap[0][2] 
-    
-    codes_dict: Dict[int, str] = {}
+        left_entry = heapq.heappop(heap)
+        right_entry = heapq.heappop(heap)
 
-    # Recursive helper function to traverse the tree and generate codes.
-    def _generate_codes_from_tree(node: HuffmanNode, current_code: str) -> None:
-        """Recursively traverses the Huffman tree to generate binary codes.
+        # Frequencies sit above the index bits, so adding the entries and
+        # masking out the index bits yields the shifted frequency sum.
+        new_freq_shifted = (left_entry + right_entry) & ~_HEAP_ID_MASK
+        heapq.heappush(heap, new_freq_shifted | len(nodes))
+        nodes.append((left_entry & _HEAP_ID_MASK, right_entry & _HEAP_ID_MASK))
 
-        Args:
-            node (HuffmanNode): The current node in the Huffman tree.
-                An int for a leaf (byte value) or a list for an internal node.
-            current_code (str): The binary code accumulated so far for this path.
-        """
-        if isinstance(node, int):  # Leaf node (byte value)
-            # Assign the accumulated code. If the tree has only one node (single unique byte),
-            # its code is '0' (handled by the `if len(heap) == 1` case).
-            # This path handles cases where current_code is empty for a single node root,
-            # which shouldn't happen if len(heap) == 1 is handled correctly.
-            codes_dict[node] = current_code if current_code else "0"
-            return
-        
-        # Internal node: node is expected to be [left_child, right_child]
-        if isinstance(node, list) and len(node) == 2:
-            _generate_codes_from_tree(node[0], current_code + '0')  # Left child gets '0'
-            _generate_codes_from_tree(node[1], current_code + '1')  # Right child gets '1'
-        # else: Malformed internal node, ideally raise error or log.
-        #       For now, assumes valid tree structure from heap construction.
-
-    # Generate codes only if the root is a tree (list structure).
-    # If frequencies contained only one item, root_node_wrapper would be an int,
-    # and that case is handled by `if len(heap) == 1`, which returns directly.
-    if isinstance(root_node_wrapper, list):
-        _generate_codes_from_tree(root_node_wrapper, "")
-    # If root_node_wrapper is an int here, it implies an issue, as the single-item
-    # case should have returned. An empty `frequencies` also returns early.
+    # The last remaining entry on the heap is the root of the Huffman tree.
+    root_index = heap[0] & _HEAP_ID_MASK
+
+    codes_dict: Dict[int, str] = {}
+    for byte_val, (code_int, code_len) in _generate_codes_from_tree(nodes, root_index).items():
+        codes_dict[byte_val] = format(code_int, f"0{code_len}b")
     
     return codes_dict
 
+def _build_code_lut(huffman_table: Dict[int, str]) -> List[str]:
+    """Lays out a Huffman table as a list indexed by byte value.
+
+    Args:
+        huffman_table (Dict[int, str]): A dictionary mapping byte values (int)
+            to their Huffman codes (binary strings).
+
+    Returns:
+        List[str]: A 256-entry list where index `b` holds the code for byte
+        `b`, or an empty string if `b` has no code in the table.
+    """
+    code_lut = [""] * 256
+    for byte_val, code in huffman_table.items():
+        code_lut[byte_val] = code
+    return code_lut
+
+@functools.lru_cache(maxsize=16)
+def _build_codebook_cached(
+    frequency_items: Tuple[Tuple[int, int], ...]
+) -> Tuple[Dict[int, str], List[str]]:
+    """Builds the Huffman table and code lookup list for a frequency table.
+
+    The key keeps the Counter's insertion order, which decides tie-breaks
+    while building the tree, so a cached codebook is identical to a freshly
+    built one.
+
+    Args:
+        frequency_items (Tuple[Tuple[int, int], ...]): The `(byte_val, freq)`
+            pairs of a frequency Counter, in insertion order.
+
+    Returns:
+        Tuple[Dict[int, str], List[str]]: The Huffman table and its 256-entry
+        code list. Both are shared between calls and must not be mutated.
+    """
+    huffman_table = _build_huffman_tree_and_codes(collections.Counter(dict(frequency_items)))
+    return huffman_table, _build_code_lut(huffman_table)
+
+def _encode_codes_to_dna(data: bytes, code_lut: List[str]) -> Tuple[str, int]:
+    """Maps each byte of `data` to its Huffman code and packs the bits into DNA.
+
+    The input is processed in blocks of `_ENCODE_BLOCK_SIZE` bytes. Each
+    block's codes are joined, prefixed with the bits left over from the
+    previous block, and every complete byte of the result is mapped to four
+    nucleotides at once. At most 7 bits are carried between blocks, so the
+    memory used besides the output is bounded by the block size.
+
+    Args:
+        data (bytes): The byte string to encode.
+        code_lut (List[str]): A 256-entry list of Huffman codes indexed by
+            byte value, as returned by `_build_code_lut`.
+
+    Returns:
+        Tuple[str, int]: A tuple containing:
+            - dna_sequence (str): The DNA sequence for the concatenated codes.
+            - num_padding_bits (int): Number of '0's (0 or 1) implied after
+              the bit stream to complete the final nucleotide.
+    """
+    dna_sequence_parts: List[str] = []
+    carry_bits = ""
+    for start in range(0, len(data), _ENCODE_BLOCK_SIZE):
+        block = data[start:start + _ENCODE_BLOCK_SIZE]
+        bits = carry_bits + "".join(map(code_lut.__getitem__, block))
+        num_whole_bits = len(bits) - len(bits) % 8
+        if num_whole_bits:
+            packed = int(bits[:num_whole_bits], 2).to_bytes(num_whole_bits // 8, 'big')
+            dna_sequence_parts.append("".join(map(_BYTE_TO_DNA.__getitem__, packed)))
+        carry_bits = bits[num_whole_bits:]
+
+    # Map the remaining whole pairs. An odd bit count needs one padding '0'
+    # for the final nucleotide, which is then "b0": 'A' for b='0' or 'C'
+    # for b='1'. Emit it directly rather than padding the bit string.
+    num_padding_bits = len(carry_bits) % 2
+    num_pair_bits = len(carry_bits) - num_padding_bits
+    for i in range(0, num_pair_bits, 2):
+        dna_sequence_parts.append(_BITS_TO_DNA[carry_bits[i:i + 2]])
+    if num_padding_bits:
+        dna_sequence_parts.append('A' if carry_bits[-1] == '0' else 'C')
+
+    return "".join(dna_sequence_parts), num_padding_bits
+
+@functools.lru_cache(maxsize=16)
+def _invert_table_cached(table_items: FrozenSet[Tuple[int, str]]) -> Dict[str, int]:
+    """Builds the code -> byte mapping for a hashable view of a Huffman table.
+
+    Args:
+        table_items (FrozenSet[Tuple[int, str]]): The `(byte_val, code)` pairs
+            of a Huffman table.
+
+    Returns:
+        Dict[str, int]: A dictionary mapping each binary code to its byte value.
+    """
+    return {code: byte_val for byte_val, code in table_items}
+
+def invert_huffman_table(huffman_table: Dict[int, str]) -> Dict[str, int]:
+    """Inverts a Huffman table so that codes map back to byte values.
+
+    The inversion is memoized on the table contents, so repeatedly decoding
+    chunks that share one table only builds it once; each call returns a copy.
+    Callers decoding many sequences may also pass the returned mapping to
+    `decode_huffman` via its `inverted_table` argument to skip the lookup.
+
+    Args:
+        huffman_table (Dict[int, str]): A dictionary mapping byte values (int)
+            to their Huffman codes (binary strings).
+
+    Returns:
+        Dict[str, int]: A dictionary mapping each binary code to its byte value.
+
+    Raises:
+        ValueError: If `huffman_table` is not a dictionary.
+    """
+    try:
+        table_items = frozenset(huffman_table.items())
+    except AttributeError: # .items() failed
+        raise ValueError("Invalid huffman_table format: must be a dictionary.")
+    return dict(_invert_table_cached(table_items))
+
+def _build_decode_lut(
+    inverted_table: Dict[str, int]
+) -> Tuple[int, List[Optional[Tuple[int, int]]]]:
+    """Builds a root lookup table for decoding Huffman codes.
+
+    The table is indexed by the next `width` bits of the encoded stream (as an
+    integer). Each entry holds `(byte_val, code_length)` for the shortest code
+    that is a prefix of those bits, or None if only codes longer than `width`
+    can match there.
+
+    Args:
+        inverted_table (Dict[str, int]): A mapping from binary codes to byte values.
+
+    Returns:
+        Tuple[int, List[Optional[Tuple[int, int]]]]: The table width in bits
+        and the table itself, with `2 ** width` entries.
+    """
+    max_code_length = max(map(len, inverted_table), default=1)
+    width = max(1, min(max_code_length, _DECODE_LUT_MAX_BITS))
+    lut: List[Optional[Tuple[int, int]]] = [None] * (1 << width)
+    # Fill longest codes first so shorter codes overwrite them. For a valid
+    # (prefix-free) table no entries overlap; otherwise this keeps the
+    # shortest-match behaviour of a bit-by-bit decoder.
+    short_codes = [code for code in inverted_table if 0 < len(code) <= width]
+    for code in sorted(short_codes, key=len, reverse=True):
+        shift = width - len(code)
+        start = int(code, 2) << shift
+        entry = (inverted_table[code], len(code))
+        for index in range(start, start + (1 << shift)):
+            lut[index] = entry
+    return width, lut
+
+@functools.lru_cache(maxsize=16)
+def _prepare_decoder_cached(
+    code_items: FrozenSet[Tuple[str, int]]
+) -> Tuple[int, List[Optional[Tuple[int, int]]], Tuple[int, ...]]:
+    """Builds the decoder state for a hashable view of an inverted Huffman table.
+
+    Args:
+        code_items (FrozenSet[Tuple[str, int]]): The `(code, byte_val)` pairs
+            of an inverted Huffman table.
+
+    Returns:
+        Tuple[int, List[Optional[Tuple[int, int]]], Tuple[int, ...]]: The root
+        lookup table width and table, as returned by `_build_decode_lut`, and
+        the sorted lengths of the codes longer than that width. The table is
+        shared between calls and must not be mutated.
+    """
+    inverted_table = dict(code_items)
+    lut_width, decode_lut = _build_decode_lut(inverted_table)
+    long_code_lengths = tuple(sorted(
+        {len(code) for code in inverted_table if len(code) > lut_width}
+    ))
+    return lut_width, decode_lut, long_code_lengths
+
 # --- Main Encoding Function ---
 
 def encode_huffman(
@@ -186,36 +382,22 @@ def encode_huffman(
         return ("", {}, 0)
 
     frequencies = _calculate_frequencies(data)
-    huffman_table = _build_huffman_tree_and_codes(frequencies)
-
-    # Construct the single binary string from Huffman codes.
-    # If data contains a byte not in huffman_table (e.g., empty data led to empty table),
-    # this would error. However, `if not data` handles empty data.
-    # If huffman_table is empty due to empty frequencies from non-empty data (should not happen),
-    # it would also error here.
-    encoded_binary_string_list = [huffman_table[byte_val] for byte_val in data]
-    encoded_binary_string = "".join(encoded_binary_string_list)
-    
-    # Determine number of padding bits needed (0 or 1) for 2-bit DNA mapping.
-    num_padding_bits = (2 - len(encoded_binary_string) % 2) % 2
-    padded_encoded_binary_string = encoded_binary_string + ('0' * num_padding_bits)
 
-    # Convert the padded binary string to a DNA sequence.
-    dna_sequence_parts: List[str] = []
-    dna_mapping = {"00": 'A', "01": 'T', "10": 'C', "11": 'G'}
-
-    # This check covers cases where data was non-empty but resulted in an empty
-    # encoded_binary_string (e.g., if all Huffman codes were empty strings, which
-    # is not standard for Huffman coding but robustly handled).
-    if not padded_encoded_binary_string: 
-        return "", huffman_table, num_padding_bits # Should align with empty data output
-
-    for i in range(0, len(padded_encoded_binary_string), 2):
-        two_bits = padded_encoded_binary_string[i:i+2]
-        # Padding ensures len(two_bits) is always 2 if padded_encoded_binary_string is not empty.
-        dna_sequence_parts.append(dna_mapping[two_bits])
-
-    dna_sequence = "".join(dna_sequence_parts)
+    if len(frequencies) == 1:
+        # Only one unique byte: its code is '0', so the binary string is all
+        # zeros and maps entirely to 'A' ("00"). Skip the tree and bit string.
+        huffman_table = {next(iter(frequencies)): '0'}
+        num_padding_bits = len(data) % 2
+        dna_sequence = 'A' * ((len(data) + num_padding_bits) // 2)
+    else:
+        # Inputs with the same byte frequencies share one cached codebook.
+        # The caller gets its own copy of the table.
+        cached_table, code_lut = _build_codebook_cached(tuple(frequencies.items()))
+        huffman_table = dict(cached_table)
+
+        # Pack the Huffman codes into DNA block by block, so the full binary
+        # string for `data` is never materialized.
+        dna_sequence, num_padding_bits = _encode_codes_to_dna(data, code_lut)
 
     if add_parity:
         if k_value <= 0:
@@ -233,7 +415,8 @@ def decode_huffman(
     num_padding_bits: int,
     check_parity: bool = False,
     k_value: int = 7,
-    parity_rule: str = PARITY_RULE_GC_EVEN_A_ODD_T
+    parity_rule: str = PARITY_RULE_GC_EVEN_A_ODD_T,
+    inverted_table: Optional[Dict[str, int]] = None
 ) -> Tuple[bytes, List[int]]:
     """Decodes a Huffman-encoded DNA sequence back into the original byte string.
 
@@ -246,7 +429,7 @@ def decode_huffman(
     2.  Removing any padding bits from the end of the binary string, based on 
         `num_padding_bits`.
     3.  Inverting the provided `huffman_table` to map binary codes back to 
-        original byte values.
+        original byte values (skipped if `inverted_table` is supplied).
     4.  Iterating through the unpadded binary string, matching prefixes against 
         the inverted Huffman codes to reconstruct the original bytes.
 
@@ -262,6 +445,10 @@ def decode_huffman(
                        `check_parity` is True. Defaults to 7. Must be positive.
         parity_rule (str): The parity rule used if `check_parity` is True.
                            Defaults to `PARITY_RULE_GC_EVEN_A_ODD_T`.
+        inverted_table (Optional[Dict[str, int]]): A precomputed code -> byte
+            mapping for `huffman_table`, as returned by `invert_huffman_table`.
+            If None, the inverted table is built (and cached) from
+            `huffman_table`. Defaults to None.
 
     Returns:
         Tuple[bytes, List[int]]: A tuple containing:
@@ -305,16 +492,16 @@ def decode_huffman(
 
 
     # 1. Convert DNA sequence (potentially stripped of parity) to its binary string.
-    binary_digits_list: List[str] = []
-    dna_to_binary_map = {'A': "00", 'T': "01", 'C': "10", 'G': "11"}
-    for char_dna in sequence_for_huffman_decode: # Use the (potentially) stripped sequence
-        binary_pair = dna_to_binary_map.get(char_dna)
-        if binary_pair is None:
-            raise ValueError(
-                f"Invalid DNA character '{char_dna}' in sequence for Huffman decoding."
-            )
-        binary_digits_list.append(binary_pair)
-    encoded_binary_string = "".join(binary_digits_list)
+    # Validation and conversion are each a single `str.translate` pass:
+    # deleting the valid nucleotides leaves only invalid characters, if any.
+    invalid_chars = sequence_for_huffman_decode.translate(_DELETE_DNA_TABLE)
+    if invalid_chars:
+        char_dna = invalid_chars[0]
+        raise ValueError(
+            f"Invalid DNA character '{char_dna}' in sequence for Huffman decoding "
+            f"(position {sequence_for_huffman_decode.index(char_dna)})."
+        )
+    encoded_binary_string = sequence_for_huffman_decode.translate(_DNA_TO_BITS_TABLE)
 
     # Handle if DNA conversion results in an empty binary string.
     if not encoded_binary_string:
@@ -354,23 +541,13 @@ def decode_huffman(
             "Unpadded binary string is empty, but Huffman table is not empty, "
             "implying all data was removed as padding."
         )
-        # was then given as 2, unpadded becomes empty, but table {'A':'0'} exists).
-        # This implies all original data was represented by bits that were then
-        # considered padding.
-        raise ValueError(
-            "Unpadded binary string is empty, but Huffman table is not empty, "
-            "implying all data was removed as padding."
-        )
 
     # 3. Invert the Huffman table for decoding.
     # Maps: binary code (str) -> original byte value (int)
-    try:
-        # Ensure huffman_table.items() can be iterated over (i.e., it's a dict)
-        inverted_huffman_table = {
-            code: byte_val for byte_val, code in huffman_table.items()
-        }
-    except AttributeError: # .items() failed
-        raise ValueError("Invalid huffman_table format: must be a dictionary.")
+    if inverted_table is not None:
+        inverted_huffman_table = inverted_table
+    else:
+        inverted_huffman_table = invert_huffman_table(huffman_table)
 
     if not inverted_huffman_table: # Should not happen if unpadded_binary_string is not empty
         raise ValueError(
@@ -378,21 +555,44 @@ def decode_huffman(
         )
 
     # 4. Decode the unpadded binary string to bytes.
-    decoded_bytes_list: List[bytes] = []
-    current_code_buffer = [] # Use list of chars for efficient joining
-    for bit in unpadded_binary_string:
-        current_code_buffer.append(bit)
-        current_prefix = "".join(current_code_buffer)
-        if current_prefix in inverted_huffman_table:
-            byte_val = inverted_huffman_table[current_prefix]
-            decoded_bytes_list.append(bytes([byte_val]))
-            current_code_buffer = [] # Reset buffer
+    # Each step reads the next `lut_width` bits as one integer and looks up the
+    # code they start with, instead of testing the table one bit at a time.
+    # Near the end of the stream the index is zero-filled on the right; an
+    # entry is then only valid if its code fits in the bits that remain.
+    # The decoder state is built once per table and reused from the cache.
+    lut_width, decode_lut, long_code_lengths = _prepare_decoder_cached(
+        frozenset(inverted_huffman_table.items())
+    )
+    binary = unpadded_binary_string
+    num_bits = len(binary)
+    decoded_bytes = bytearray()
+    position = 0
+    while position < num_bits:
+        chunk = binary[position:position + lut_width]
+        entry = decode_lut[int(chunk, 2) << (lut_width - len(chunk))]
+        if entry is not None:
+            byte_val, code_length = entry
+            if code_length > len(chunk):
+                break # Only a partial code remains.
+        else:
+            # No code up to `lut_width` bits matches; try the longer codes.
+            byte_val = None
+            for code_length in long_code_lengths:
+                if position + code_length > num_bits:
+                    break
+                byte_val = inverted_huffman_table.get(binary[position:position + code_length])
+                if byte_val is not None:
+                    break
+            if byte_val is None:
+                break
+        decoded_bytes.append(byte_val)
+        position += code_length
     
-    # If there are remaining bits in the buffer, they don't form a valid code.
-    if current_code_buffer: 
+    # If there are remaining bits, they don't form a valid code.
+    if position < num_bits:
         raise ValueError(
             f"Corrupted data or incorrect Huffman table: "
-            f"remaining unparsed bits '{"".join(current_code_buffer)}'."
+            f"remaining unparsed bits '{binary[position:]}'."
         )
 
-    return b"".join(decoded_bytes_list), parity_errors
+    return bytes(decoded_bytes), parity_errors
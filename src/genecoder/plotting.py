@@ -6,11 +6,69 @@ rendered to in-memory buffers for display in Flet or other GUI frameworks.
 """
 import io
 import collections
-from typing import Dict, List, Tuple # For older Python; can be dict, list, tuple for 3.9+
+import itertools
+import re
+import threading
+from typing import TYPE_CHECKING, Dict, List, Tuple # For older Python; can be dict, list, tuple for 3.9+
+
+# Matplotlib is imported inside the plot generators rather than here. Importing
+# it takes roughly half a second and tens of MB, which the data-preparation
+# functions in this module never need. No backend has to be selected: figures
+# are built without pyplot, and `Figure.savefig` renders PNGs with Agg.
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+    from matplotlib.patches import Patch
+
+# Figures are created once per plot type and redrawn on later calls, which
+# avoids rebuilding Matplotlib's figure, axes, and font state every time.
+# Figures are built directly (not via pyplot), so they are never registered
+# with pyplot's global figure manager. The lock serializes redraws, since
+# the GUI may request plots from several tasks.
+_FIGURE_CACHE: Dict[str, Tuple["Figure", "Axes"]] = {}
+_FIGURE_CACHE_LOCK = threading.Lock()
+
+
+def _get_cleared_axes(plot_name: str, figsize: Tuple[float, float]) -> Tuple["Figure", "Axes"]:
+    """Returns the cached figure and axes for a plot, cleared for redrawing.
+
+    Must be called with `_FIGURE_CACHE_LOCK` held.
 
-import matplotlib
-matplotlib.use('Agg') # Set Matplotlib backend to Agg for headless environments
-import matplotlib.pyplot as plt
+    Args:
+        plot_name (str): The cache key identifying the plot type.
+        figsize (Tuple[float, float]): The figure size in inches, used when
+            the figure is first created.
+
+    Returns:
+        Tuple[Figure, Axes]: The figure and its single, empty axes.
+    """
+    cached = _FIGURE_CACHE.get(plot_name)
+    if cached is None:
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=figsize)
+        ax = fig.subplots()
+        _FIGURE_CACHE[plot_name] = (fig, ax)
+        return fig, ax
+    fig, ax = cached
+    ax.clear()
+    return fig, ax
+
+
+def _render_png(fig: "Figure") -> io.BytesIO:
+    """Lays out a figure and renders it as a PNG image into a BytesIO buffer.
+
+    Args:
+        fig (Figure): The figure to render.
+
+    Returns:
+        io.BytesIO: A buffer containing the PNG data, rewound to the start.
+    """
+    fig.tight_layout()  # Adjust layout to prevent labels from being cut off
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png')
+    buf.seek(0) # Rewind the buffer to the beginning
+    return buf
 
 
 def prepare_huffman_codeword_length_data(huffman_table: Dict[int, str]) -> collections.Counter:
@@ -31,9 +89,8 @@ def prepare_huffman_codeword_length_data(huffman_table: Dict[int, str]) -> colle
     if not huffman_table:
         return collections.Counter()
 
-    codeword_lengths: List[int] = [len(code) for code in huffman_table.values()]
-    length_counts = collections.Counter(codeword_lengths)
-    return length_counts
+    # Counting via map(len, ...) keeps the whole pass in C, with no intermediate list.
+    return collections.Counter(map(len, huffman_table.values()))
 
 
 def generate_codeword_length_histogram(length_counts: collections.Counter) -> io.BytesIO:
@@ -48,48 +105,41 @@ def generate_codeword_length_histogram(length_counts: collections.Counter) -> io
         generated histogram. If `length_counts` is empty, it returns a
         BytesIO buffer containing a plot with a "No data to display" message.
     """
-    fig, ax = plt.subplots(figsize=(8, 6)) # Adjust figsize as needed
-
-    if not length_counts:
-        ax.text(0.5, 0.5, "No data to display for histogram.", 
-                horizontalalignment='center', verticalalignment='center', 
-                transform=ax.transAxes, fontsize=12, color='gray')
-        ax.set_xlabel("Codeword Length (bits)")
-        ax.set_ylabel("Frequency (Number of Codewords)")
-        ax.set_title("Huffman Codeword Length Distribution")
-    else:
-        sorted_lengths = sorted(length_counts.keys())
-        counts = [length_counts[length] for length in sorted_lengths]
-
-        ax.bar(sorted_lengths, counts, width=0.8, align='center', color='skyblue')
-        ax.set_xlabel("Codeword Length (bits)")
-        ax.set_ylabel("Frequency (Number of Codewords)")
-        ax.set_title("Huffman Codeword Length Distribution")
-        
-        # Set x-ticks: if there are many unique lengths, this might become crowded.
-        # A common strategy is to show all if less than a threshold, or a subset otherwise.
-        if len(sorted_lengths) <= 20: # Threshold for showing all ticks
-            ax.set_xticks(sorted_lengths)
+    from matplotlib.ticker import MaxNLocator
+
+    with _FIGURE_CACHE_LOCK:
+        fig, ax = _get_cleared_axes("codeword_length_histogram", figsize=(8, 6))
+
+        if not length_counts:
+            ax.text(0.5, 0.5, "No data to display for histogram.", 
+                    horizontalalignment='center', verticalalignment='center', 
+                    transform=ax.transAxes, fontsize=12, color='gray')
+            ax.set_xlabel("Codeword Length (bits)")
+            ax.set_ylabel("Frequency (Number of Codewords)")
+            ax.set_title("Huffman Codeword Length Distribution")
         else:
-            # For many lengths, matplotlib's default ticker might be better,
-            # or a custom ticker can be implemented (e.g., MaxNLocator).
-            # For now, let default behavior handle it if too many.
-            pass 
-        
-        # Ensure y-axis ticks are integers if counts are always integers
-        ax.yaxis.set_major_locator(plt.MaxNLocator(integer=True))
-
+            sorted_lengths = sorted(length_counts.keys())
+            counts = [length_counts[length] for length in sorted_lengths]
 
-    plt.tight_layout()  # Adjust layout to prevent labels from being cut off
-
-    buf = io.BytesIO()
-    try:
-        plt.savefig(buf, format='png')
-        buf.seek(0) # Rewind the buffer to the beginning
-    finally:
-        plt.close(fig) # Close the figure to free up memory
+            ax.bar(sorted_lengths, counts, width=0.8, align='center', color='skyblue')
+            ax.set_xlabel("Codeword Length (bits)")
+            ax.set_ylabel("Frequency (Number of Codewords)")
+            ax.set_title("Huffman Codeword Length Distribution")
+        
+            # Set x-ticks: if there are many unique lengths, this might become crowded.
+            # A common strategy is to show all if less than a threshold, or a subset otherwise.
+            if len(sorted_lengths) <= 20: # Threshold for showing all ticks
+                ax.set_xticks(sorted_lengths)
+            else:
+                # For many lengths, matplotlib's default ticker might be better,
+                # or a custom ticker can be implemented (e.g., MaxNLocator).
+                # For now, let default behavior handle it if too many.
+                pass 
+        
+            # Ensure y-axis ticks are integers if counts are always integers
+            ax.yaxis.set_major_locator(MaxNLocator(integer=True))
 
-    return buf
+        return _render_png(fig)
 
 
 def prepare_nucleotide_frequency_data(dna_sequence: str) -> collections.Counter:
@@ -106,16 +156,9 @@ def prepare_nucleotide_frequency_data(dna_sequence: str) -> collections.Counter:
         collections.Counter: A Counter mapping each nucleotide ('A', 'T', 'C', 'G')
         to its frequency.
     """
-    # Initialize with all standard nucleotides to ensure they are in the output
-    nucleotide_counts = collections.Counter({'A': 0, 'T': 0, 'C': 0, 'G': 0})
-    
-    # Count only the valid nucleotides from the sequence
-    valid_nucleotide_counts = collections.Counter(
-        nt for nt in dna_sequence if nt in {'A', 'T', 'C', 'G'}
-    )
-    nucleotide_counts.update(valid_nucleotide_counts) # Add counts from sequence
-    
-    return nucleotide_counts
+    # One C-level `str.count` pass per nucleotide; other characters are
+    # never looked at, and all four nucleotides are always present.
+    return collections.Counter({nt: dna_sequence.count(nt) for nt in 'ATCG'})
 
 
 def generate_nucleotide_frequency_plot(nucleotide_counts: collections.Counter) -> io.BytesIO:
@@ -130,36 +173,38 @@ def generate_nucleotide_frequency_plot(nucleotide_counts: collections.Counter) -
         generated bar plot. If all counts are zero, it returns a plot
         with a "No nucleotide data to display." message.
     """
-    fig, ax = plt.subplots(figsize=(6, 5)) # Adjust figsize as needed
+    from matplotlib.ticker import MaxNLocator
+
+    with _FIGURE_CACHE_LOCK:
+        fig, ax = _get_cleared_axes("nucleotide_frequency", figsize=(6, 5))
 
-    nucleotides_for_plot = ['A', 'T', 'C', 'G']
-    counts = [nucleotide_counts.get(nt, 0) for nt in nucleotides_for_plot]
+        nucleotides_for_plot = ['A', 'T', 'C', 'G']
+        counts = [nucleotide_counts.get(nt, 0) for nt in nucleotides_for_plot]
 
-    if all(c == 0 for c in counts) and not any(nucleotide_counts.values()): # Check if effectively empty
-        ax.text(0.5, 0.5, "No nucleotide data to display.", 
-                horizontalalignment='center', verticalalignment='center', 
-                transform=ax.transAxes, fontsize=12, color='gray')
-    else:
-        ax.bar(nucleotides_for_plot, counts, color=['cornflowerblue', 'lightgreen', 'sandybrown', 'lightcoral'])
+        if all(c == 0 for c in counts) and not any(nucleotide_counts.values()): # Check if effectively empty
+            ax.text(0.5, 0.5, "No nucleotide data to display.", 
+                    horizontalalignment='center', verticalalignment='center', 
+                    transform=ax.transAxes, fontsize=12, color='gray')
+        else:
+            ax.bar(nucleotides_for_plot, counts, color=['cornflowerblue', 'lightgreen', 'sandybrown', 'lightcoral'])
     
-    ax.set_xlabel("Nucleotide")
-    ax.set_ylabel("Frequency (Count)")
-    ax.set_title("Nucleotide Frequency Distribution")
-    ax.yaxis.set_major_locator(plt.MaxNLocator(integer=True)) # Ensure y-axis has integer ticks
+        ax.set_xlabel("Nucleotide")
+        ax.set_ylabel("Frequency (Count)")
+        ax.set_title("Nucleotide Frequency Distribution")
+        ax.yaxis.set_major_locator(MaxNLocator(integer=True)) # Ensure y-axis has integer ticks
 
-    plt.tight_layout()
+        return _render_png(fig)
 
-    buf = io.BytesIO()
-    try:
-        plt.savefig(buf, format='png')
-        buf.seek(0)
-    finally:
-        plt.close(fig)
 
-    return buf
+# --- New functions for sequence analysis plotting ---
 
+# With fewer windows than this the per-window `str.count` loop beats the
+# fixed cost of building prefix sums, so NumPy is not even imported.
+_NUMPY_GC_MIN_WINDOWS = 32
 
-# --- New functions for sequence analysis plotting ---
+# Byte -> 0/1 indicator tables for the stdlib prefix-sum path.
+_GC_INDICATOR_TABLE = bytes(1 if b in b"GC" else 0 for b in range(256))
+_ATCG_INDICATOR_TABLE = bytes(1 if b in b"ATCG" else 0 for b in range(256))
 
 def calculate_windowed_gc_content(dna_sequence: str, window_size: int, step: int) -> tuple[list[int], list[float]]:
     """Calculates GC content for each sliding window along a DNA sequence.
@@ -188,35 +233,82 @@ def calculate_windowed_gc_content(dna_sequence: str, window_size: int, step: int
 
     upper_sequence = dna_sequence.upper()
     seq_len = len(upper_sequence)
-    window_starts: list[int] = []
-    gc_values: list[float] = []
 
     if seq_len < window_size:
-        return window_starts, gc_values
-
+        return [], []
+
+    num_windows = (seq_len - window_size) // step + 1
+    if num_windows >= _NUMPY_GC_MIN_WINDOWS:
+        try:
+            return _windowed_gc_content_numpy(upper_sequence, window_size, step)
+        except ImportError:
+            # NumPy is optional; the stdlib prefix sums are still O(N).
+            return _windowed_gc_content_prefix_sums(upper_sequence, window_size, step)
+
+    window_starts = []
+    gc_values = []
     for i in range(0, seq_len - window_size + 1, step):
         window = upper_sequence[i:i + window_size]
-        
-        gc_count = 0
-        atcg_count = 0
-        for base in window:
-            if base == 'G' or base == 'C':
-                gc_count += 1
-                atcg_count += 1
-            elif base == 'A' or base == 'T':
-                atcg_count += 1
-        
+        gc_count = window.count('G') + window.count('C')
+        atcg_count = gc_count + window.count('A') + window.count('T')
+
         if atcg_count == 0: # Window contains no ATCG characters
             gc_content = 0.0
         else:
             gc_content = gc_count / atcg_count
-            
+
         window_starts.append(i)
         gc_values.append(gc_content)
-        
+
     return window_starts, gc_values
 
 
+def _windowed_gc_content_prefix_sums(upper_sequence: str, window_size: int, step: int) -> tuple[list[int], list[float]]:
+    """Standard-library prefix-sum variant of `calculate_windowed_gc_content`."""
+    # Same masking as the NumPy path: non-ASCII characters become '?', and the
+    # translate tables turn each byte into a 0/1 G/C or A/T/C/G indicator.
+    bases = upper_sequence.encode('ascii', errors='replace')
+    gc_cumsum = list(itertools.accumulate(bases.translate(_GC_INDICATOR_TABLE), initial=0))
+    atcg_cumsum = list(itertools.accumulate(bases.translate(_ATCG_INDICATOR_TABLE), initial=0))
+
+    window_starts = list(range(0, len(upper_sequence) - window_size + 1, step))
+    gc_values = []
+    for start in window_starts:
+        end = start + window_size
+        atcg_count = atcg_cumsum[end] - atcg_cumsum[start]
+        # Windows with no ATCG characters get a GC content of 0.0.
+        gc_values.append((gc_cumsum[end] - gc_cumsum[start]) / atcg_count if atcg_count else 0.0)
+
+    return window_starts, gc_values
+
+
+def _windowed_gc_content_numpy(upper_sequence: str, window_size: int, step: int) -> tuple[list[int], list[float]]:
+    """NumPy prefix-sum variant of `calculate_windowed_gc_content`.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    import numpy as np
+
+    # Prefix sums of the G/C and A/T/C/G indicator masks turn each window's
+    # counts into two O(1) lookups. Non-ASCII characters become '?', which is
+    # neither counted nor changes positions.
+    bases = np.frombuffer(upper_sequence.encode('ascii', errors='replace'), dtype=np.uint8)
+    gc_mask = (bases == ord('G')) | (bases == ord('C'))
+    atcg_mask = gc_mask | (bases == ord('A')) | (bases == ord('T'))
+    gc_cumsum = np.concatenate(([0], np.cumsum(gc_mask, dtype=np.int64)))
+    atcg_cumsum = np.concatenate(([0], np.cumsum(atcg_mask, dtype=np.int64)))
+
+    starts = np.arange(0, len(upper_sequence) - window_size + 1, step)
+    ends = starts + window_size
+    gc_counts = gc_cumsum[ends] - gc_cumsum[starts]
+    atcg_counts = atcg_cumsum[ends] - atcg_cumsum[starts]
+    # Windows with no ATCG characters get a GC content of 0.0.
+    gc_values = np.where(atcg_counts > 0, gc_counts / np.maximum(atcg_counts, 1), 0.0)
+
+    return starts.tolist(), gc_values.tolist()
+
+
 def identify_homopolymer_regions(dna_sequence: str, min_len: int) -> list[tuple[int, int, str]]:
     """Identifies homopolymer regions of a minimum length in a DNA sequence.
 
@@ -236,35 +328,18 @@ def identify_homopolymer_regions(dna_sequence: str, min_len: int) -> list[tuple[
     if not isinstance(min_len, int) or min_len < 2:
         raise ValueError("min_len must be an integer greater than or equal to 2.")
 
-    regions: list[tuple[int, int, str]] = []
-    seq_len = len(dna_sequence)
-    if seq_len < min_len:
-        return regions
-
-    upper_sequence = dna_sequence.upper() # Process case-insensitively
-
-    current_streak_char = ''
-    current_streak_len = 0
-    current_streak_start = -1
+    if len(dna_sequence) < min_len:
+        return []
 
-    for i, base in enumerate(upper_sequence):
-        if base == current_streak_char:
-            current_streak_len += 1
-        else:
-            # End of a streak (or start of sequence)
-            if current_streak_len >= min_len:
-                regions.append((current_streak_start, i - 1, current_streak_char))
-            
-            # Start new streak
-            current_streak_char = base
-            current_streak_len = 1
-            current_streak_start = i
-
-    # Check for a homopolymer at the end of the sequence
-    if current_streak_len >= min_len:
-        regions.append((current_streak_start, seq_len - 1, current_streak_char))
-        
-    return regions
+    # A run of at least `min_len` identical characters is one character
+    # followed by `min_len - 1` or more repeats of it. Matching greedily means
+    # each match spans a whole run; the scan itself runs in the C regex engine.
+    # Sequences are processed case-insensitively.
+    homopolymer_pattern = re.compile(rf"(.)\1{{{min_len - 1},}}", re.DOTALL)
+    return [
+        (match.start(), match.end() - 1, match.group(1))
+        for match in homopolymer_pattern.finditer(dna_sequence.upper())
+    ]
 
 
 def generate_sequence_analysis_plot(
@@ -284,55 +359,68 @@ def generate_sequence_analysis_plot(
     Returns:
         io.BytesIO: A BytesIO buffer containing the PNG image data of the plot.
     """
-    fig, ax1 = plt.subplots(figsize=(12, 6))
-
-    # Plot GC content
-    window_starts, gc_values = gc_windows_data
-    if window_starts and gc_values:
-        ax1.plot(window_starts, gc_values, label='Windowed GC Content', color='b', linestyle='-', marker='.')
-        ax1.set_xlabel("Sequence Position (bp)")
-        ax1.set_ylabel("GC Content", color='b')
+    from matplotlib.collections import PolyCollection
+    from matplotlib.patches import Patch
+
+    with _FIGURE_CACHE_LOCK:
+        fig, ax1 = _get_cleared_axes("sequence_analysis", figsize=(12, 6))
+
+        # Plot GC content
+        window_starts, gc_values = gc_windows_data
+        if window_starts and gc_values:
+            ax1.plot(window_starts, gc_values, label='Windowed GC Content', color='b', linestyle='-', marker='.')
+            ax1.set_xlabel("Sequence Position (bp)")
+            ax1.set_ylabel("GC Content", color='b')
+            ax1.set_ylim(0, 1.05) # GC content is between 0 and 1
+        else:
+            ax1.set_xlabel("Sequence Position (bp)")
+            ax1.set_ylabel("GC Content", color='b')
+            ax1.text(0.5, 0.6, "No GC content data to display.", 
+                     horizontalalignment='center', verticalalignment='center', 
+                     transform=ax1.transAxes, fontsize=10, color='gray')
+        # Set for both cases: tick_params settings survive ax.clear() on the cached axes.
         ax1.tick_params(axis='y', labelcolor='b')
-        ax1.set_ylim(0, 1.05) # GC content is between 0 and 1
-    else:
-        ax1.set_xlabel("Sequence Position (bp)")
-        ax1.set_ylabel("GC Content", color='b')
-        ax1.text(0.5, 0.6, "No GC content data to display.", 
-                 horizontalalignment='center', verticalalignment='center', 
-                 transform=ax1.transAxes, fontsize=10, color='gray')
-
-    ax1.set_xlim(0, sequence_length)
-
-    # Overlay homopolymer regions
-    # We can use a secondary y-axis for visual separation if needed, but for axvspan it's not strictly necessary.
-    # For simplicity, we'll plot on the same axis area.
-    if homopolymers:
-        # Define colors for homopolymers or use a generic one
-        homopolymer_colors = {'A': 'lightcoral', 'T': 'lightgreen', 'C': 'lightskyblue', 'G': 'gold'}
-        default_color = 'lightgrey'
-        
-        for start, end, base in homopolymers:
-            color = homopolymer_colors.get(base.upper(), default_color)
-            ax1.axvspan(start, end + 1, alpha=0.3, color=color, label=f'{base}-Homopolymer' if start == homopolymers[0][0] else None) 
-            # The end+1 is because axvspan's xmax is exclusive for the highlighted region in some interpretations,
-            # but visually it should cover the 'end' base. Let's test this.
-            # Matplotlib axvspan: xmax is exclusive. So end + 1 is correct to include the end base.
-
-        # Create a legend for homopolymers if needed, but it can get crowded.
-        # A simpler approach is to just color them. For now, let's skip a complex legend for axvspan.
-        # If a legend is desired, one would collect unique labels.
-        # handles, labels = plt.gca().get_legend_handles_labels()
-        # by_label = dict(zip(labels, handles))
-        # plt.legend(by_label.values(), by_label.keys())
-
-    ax1.set_title("Sequence GC Content and Homopolymer Analysis")
-    fig.tight_layout() # otherwise the right y-label is slightly clipped
 
-    buf = io.BytesIO()
-    try:
-        plt.savefig(buf, format='png')
-        buf.seek(0)
-    finally:
-        plt.close(fig)
+        ax1.set_xlim(0, sequence_length)
 
-    return buf
+        # Overlay homopolymer regions
+        # We can use a secondary y-axis for visual separation if needed, but for axvspan it's not strictly necessary.
+        # For simplicity, we'll plot on the same axis area.
+        if homopolymers:
+            # Define colors for homopolymers or use a generic one
+            homopolymer_colors = {'A': 'lightcoral', 'T': 'lightgreen', 'C': 'lightskyblue', 'G': 'gold'}
+            default_color = 'lightgrey'
+        
+            # Group the spans by base and draw each group as a single collection.
+            # One artist per base instead of one axvspan polygon per homopolymer
+            # keeps draw time flat for sequences with thousands of runs.
+            spans_by_base: Dict[str, List[List[Tuple[int, int]]]] = {}
+            for start, end, base in homopolymers:
+                # end is inclusive, so the span runs to end + 1 to cover the 'end' base.
+                spans_by_base.setdefault(base.upper(), []).append(
+                    [(start, 0), (start, 1), (end + 1, 1), (end + 1, 0)]
+                )
+
+            # Known bases first in A/T/C/G order, so the legend order is stable.
+            ordered_bases = [b for b in homopolymer_colors if b in spans_by_base]
+            ordered_bases += [b for b in spans_by_base if b not in homopolymer_colors]
+
+            legend_handles: List["Patch"] = []
+            for base in ordered_bases:
+                spans = spans_by_base[base]
+                color = homopolymer_colors.get(base, default_color)
+                # Like axvspan, x is in data coordinates and y spans the full axes
+                # height. autolim=False keeps the spans out of y autoscaling.
+                ax1.add_collection(
+                    PolyCollection(spans, alpha=0.3, color=color,
+                                   transform=ax1.get_xaxis_transform()),
+                    autolim=False,
+                )
+                legend_handles.append(Patch(facecolor=color, alpha=0.3, label=f'{base}-Homopolymer'))
+
+            # One legend entry per base present, built once rather than labelling spans.
+            ax1.legend(handles=legend_handles, loc='upper right')
+
+        ax1.set_title("Sequence GC Content and Homopolymer Analysis")
+
+        return _render_png(fig)
@@ -1,44 +1,52 @@
-import pytest
-import subprocess
+import contextlib
+import io
 import os
 import shutil
-import tempfile
+import sys
 from pathlib import Path
+from types import SimpleNamespace
 
 # Helper to get the root of the project
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / 'src')) # Add src directory to Python path for module import
+
+import cli
+from genecoder.encoders import encode_base4_direct
+from genecoder.formats import to_fasta
+
+def run_cli_command(command_args: list[str]) -> SimpleNamespace:
+    """Helper function to run CLI commands in-process.
+
+    Calls `cli.main` directly instead of starting a new interpreter, which
+    avoids paying interpreter startup and package import cost in every test.
+    Returns an object with `returncode`, `stdout` and `stderr` attributes.
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            cli.main(command_args)
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else 1
+    return SimpleNamespace(returncode=returncode, stdout=stdout.getvalue(), stderr=stderr.getvalue())
+
+def test_encode_single_file_with_output_file(tmp_path: Path):
+    """Test encoding a single file to an explicit --output-file."""
+    input_file = tmp_path / "file1.txt"
+    input_file.write_text("single output file test")
+    output_file = tmp_path / "file1.fasta"
+
+    result = run_cli_command(["encode", "--input-files", str(input_file), "--output-file", str(output_file)])
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
-
-def run_cli_command(command_args: list[str], env=None) -> subprocess.CompletedProcess:
-    """Helper function to run CLI commands."""
-    if env is None:
-        env = os.environ.copy()
-        # Ensure PYTHONPATH includes the project root so src.cli can be found
-        env['PYTHONPATH'] = str(PROJECT_ROOT) + os.pathsep + env.get('PYTHONPATH', '')
-
-    # Construct the command
-    # Using python -m src.cli is generally more robust for module resolution
-    full_command = [sys.executable, "-m", "src.cli"] + command_args
-    
-    return subprocess.run(
-        full_command,
-        capture_output=True,
-        text=True,
-        env=env,
-        cwd=PROJECT_ROOT # Run from project root
-    )
+    assert result.returncode == 0, f"CLI command failed with error: {result.stderr}"
+    assert output_file.exists(), f"Output file {output_file} was not created."
 
 # --- Test Scenarios for Batch Encoding ---
 
-def test_batch_encode_success(temp_dir: Path):
+def test_batch_encode_success(tmp_path: Path):
     """Test successful batch encoding with multiple input files."""
-    input_dir = temp_dir / "input_encode"
-    output_dir = temp_dir / "output_encode"
+    input_dir = tmp_path / "input_encode"
+    output_dir = tmp_path / "output_encode"
     input_dir.mkdir()
     output_dir.mkdir()
 
@@ -69,9 +77,9 @@ def test_batch_encode_success(temp_dir: Path):
         assert f"method=base4_direct" in fasta_content
         assert f"input_file={base_name}" in fasta_content
 
-def test_batch_encode_error_no_output_dir(temp_dir: Path):
+def test_batch_encode_error_no_output_dir(tmp_path: Path):
     """Test batch encoding error when --output-dir is missing for multiple files."""
-    input_dir = temp_dir / "input_err_encode"
+    input_dir = tmp_path / "input_err_encode"
     input_dir.mkdir()
     
     file1 = input_dir / "file1.txt"
@@ -85,10 +93,10 @@ def test_batch_encode_error_no_output_dir(temp_dir: Path):
     assert result.returncode != 0, "CLI command should have failed."
     assert "--output-dir is required" in result.stderr or "Error: --output-dir is required" in result.stderr
 
-def test_batch_encode_single_file_with_output_dir(temp_dir: Path):
+def test_batch_encode_single_file_with_output_dir(tmp_path: Path):
     """Test batch encoding with a single file and --output-dir."""
-    input_dir = temp_dir / "input_single_encode"
-    output_dir = temp_dir / "output_single_encode"
+    input_dir = tmp_path / "input_single_encode"
+    output_dir = tmp_path / "output_single_encode"
     input_dir.mkdir()
     output_dir.mkdir()
 
@@ -111,18 +119,15 @@ def create_dummy_fasta_file(file_path: Path, content: str, method: str = "base4_
     """Helper to create a dummy FASTA file for decoding tests."""
     # This is a simplified FASTA creation, assuming base4_direct for simplicity
     # A more robust way would be to call the encoder itself.
-    from src.genecoder.encoders import encode_base4_direct
-    from src.genecoder.formats import to_fasta
-    
     encoded_dna = encode_base4_direct(content.encode('utf-8'))
     header = f"method={method} input_file={input_filename}"
     fasta_content = to_fasta(encoded_dna, header)
     file_path.write_text(fasta_content)
 
-def test_batch_decode_success(temp_dir: Path):
+def test_batch_decode_success(tmp_path: Path):
     """Test successful batch decoding with multiple input FASTA files."""
-    input_dir = temp_dir / "input_decode_fasta"
-    output_dir = temp_dir / "output_decode"
+    input_dir = tmp_path / "input_decode_fasta"
+    output_dir = tmp_path / "output_decode"
     input_dir.mkdir()
     output_dir.mkdir()
 
@@ -155,9 +160,9 @@ def test_batch_decode_success(temp_dir: Path):
             decoded_content = expected_output_file.read_text()
             assert decoded_content == "test content 1"
 
-def test_batch_decode_error_no_output_dir(temp_dir: Path):
+def test_batch_decode_error_no_output_dir(tmp_path: Path):
     """Test batch decoding error when --output-dir is missing for multiple files."""
-    input_dir = temp_dir / "input_err_decode"
+    input_dir = tmp_path / "input_err_decode"
     input_dir.mkdir()
     
     file1_fasta = input_dir / "file1.fasta"
@@ -171,10 +176,10 @@ def test_batch_decode_error_no_output_dir(temp_dir: Path):
     assert result.returncode != 0, "CLI command should have failed."
     assert "--output-dir is required" in result.stderr or "Error: --output-dir is required" in result.stderr
 
-def test_batch_decode_single_file_with_output_dir(temp_dir: Path):
+def test_batch_decode_single_file_with_output_dir(tmp_path: Path):
     """Test batch decoding with a single file and --output-dir."""
-    input_dir = temp_dir / "input_single_decode"
-    output_dir = temp_dir / "output_single_decode"
+    input_dir = tmp_path / "input_single_decode"
+    output_dir = tmp_path / "output_single_decode"
     input_dir.mkdir()
     output_dir.mkdir()
 
@@ -191,6 +196,3 @@ def test_batch_decode_single_file_with_output_dir(temp_dir: Path):
     expected_output_file = output_dir / ("file1_decoded.bin")
     assert expected_output_file.exists(), f"Output file {expected_output_file} was not created."
     assert expected_output_file.read_text() == "single decode test"
-
-# Need to import sys for sys.executable in run_cli_command
-import sys
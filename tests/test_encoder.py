@@ -1,3 +1,4 @@
+import io
 import unittest
 from dna_encoder import encoder
 
@@ -30,6 +31,31 @@ class TestBase4Encoding(unittest.TestCase):
         # 11101111 -> TGTT (Corrected from TTTT)
         self.assertEqual(encoder.encode_base4(b'\x01\x23\x45\x67\x89\xAB\xCD\xEF'), "AAACAGATCACCCGCTGAGCGGGTTATCTGTT")
 
+    # Tests for encode_base4_to
+    def test_encode_to_stream_matches_encode(self):
+        data = bytes(range(256)) * 3
+        expected = encoder.encode_base4(data).encode("ascii")
+        for chunk_size in (1, 7, 256, 10000):
+            with self.subTest(chunk_size=chunk_size):
+                out = io.BytesIO()
+                written = encoder.encode_base4_to(data, out, chunk_size=chunk_size)
+                self.assertEqual(out.getvalue(), expected)
+                self.assertEqual(written, len(expected))
+
+    def test_encode_to_stream_from_file_object(self):
+        out = io.BytesIO()
+        self.assertEqual(encoder.encode_base4_to(io.BytesIO(b'Hi'), out, chunk_size=1), 8)
+        self.assertEqual(out.getvalue(), b"CAGACGGC")
+
+    def test_encode_to_stream_empty(self):
+        out = io.BytesIO()
+        self.assertEqual(encoder.encode_base4_to(b'', out), 0)
+        self.assertEqual(out.getvalue(), b"")
+
+    def test_encode_to_stream_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            encoder.encode_base4_to(b'Hi', io.BytesIO(), chunk_size=0)
+
     # Tests for decode_base4
     def test_decode_empty(self):
         self.assertEqual(encoder.decode_base4(""), b'')
@@ -72,6 +98,34 @@ class TestBase4Encoding(unittest.TestCase):
             encoder.decode_base4("AAAAA")
 
 
+    # Tests for decode_base4_to
+    def test_decode_to_stream_matches_decode(self):
+        data = bytes(range(256)) * 3
+        dna = encoder.encode_base4(data).encode("ascii")
+        for chunk_size in (1, 7, 256, 10000):
+            with self.subTest(chunk_size=chunk_size):
+                out = io.BytesIO()
+                written = encoder.decode_base4_to(io.BytesIO(dna), out, chunk_size=chunk_size)
+                self.assertEqual(out.getvalue(), data)
+                self.assertEqual(written, len(data))
+
+    def test_decode_to_stream_invalid_input(self):
+        with self.assertRaisesRegex(ValueError, "Invalid character in DNA sequence: X"):
+            encoder.decode_base4_to(io.BytesIO(b"AAAACGTX"), io.BytesIO(), chunk_size=1)
+        with self.assertRaisesRegex(ValueError, "Invalid DNA sequence length for byte conversion."):
+            encoder.decode_base4_to(io.BytesIO(b"AAAACG"), io.BytesIO(), chunk_size=1)
+        with self.assertRaises(ValueError):
+            encoder.decode_base4_to(io.BytesIO(b"AAAA"), io.BytesIO(), chunk_size=0)
+
+    def test_stream_roundtrip_through_file(self):
+        data = b'\xDE\xAD\xBE\xEF' * 1000
+        dna_file = io.BytesIO()
+        encoder.encode_base4_to(data, dna_file, chunk_size=100)
+        dna_file.seek(0)
+        out = io.BytesIO()
+        encoder.decode_base4_to(dna_file, out, chunk_size=100)
+        self.assertEqual(out.getvalue(), data)
+
     # Round-trip tests
     def test_roundtrip_empty(self):
         self.assertEqual(encoder.decode_base4(encoder.encode_base4(b'')), b'')
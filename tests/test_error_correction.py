@@ -263,6 +263,16 @@ def test_decode_triple_repeat_valid_inputs_updated(input_seq, expected_output, e
     assert corrected == expected_corrected
     assert uncorrectable == expected_uncorrectable
 
+@pytest.mark.parametrize("suffix", ["", "é"]) # ASCII and non-ASCII inputs
+def test_decode_triple_repeat_long_mixed_errors(suffix):
+    # Clean, corrected ("AAG", "CTC", "GTT") and uncorrectable ("ACG")
+    # triplets, repeated so that errors are spread across a long sequence.
+    unit = "AAA" + "AAG" + "CCC" + "CTC" + "GTT" + "ACG" + "TTT"
+    decoded_seq, corrected, uncorrectable = decode_triple_repeat(unit * 500 + suffix * 3)
+    assert decoded_seq == "AACCTAT" * 500 + suffix
+    assert corrected == 3 * 500
+    assert uncorrectable == 500
+
 # Removing the original test_decode_triple_repeat_valid_inputs to avoid pytest collecting it twice
 # (or I could rename it, but since I have specific tests for the contentious cases,
 # and an updated parametrize, this is cleaner).
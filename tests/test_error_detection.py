@@ -145,6 +145,30 @@ class TestParityLogic(unittest.TestCase):
         pass
 
 
+    def test_add_and_strip_match_per_block_parity(self):
+        # Covers the strided fast path (many short blocks, up to k=64), the
+        # per-block loop (large k, few blocks), a short final block, and
+        # non-ASCII input.
+        dna = "ATCGGCTA" * 2100 + "GCG"
+        for sequence in (dna, dna + "é"):
+            for k in (1, 3, 7, 64, 65, 100, 5000):
+                with self.subTest(k=k, non_ascii=not sequence.isascii()):
+                    blocks = [sequence[i:i + k] for i in range(0, len(sequence), k)]
+                    expected = "".join(b + _calculate_gc_parity(b) for b in blocks)
+                    with_parity = add_parity_to_sequence(sequence, k, PARITY_RULE_GC_EVEN_A_ODD_T)
+                    self.assertEqual(with_parity, expected)
+                    self.assertEqual(
+                        strip_and_verify_parity(with_parity, k, PARITY_RULE_GC_EVEN_A_ODD_T),
+                        (sequence, []),
+                    )
+                    # Flip the parity nucleotide of the second block.
+                    corrupted = list(with_parity)
+                    corrupted[2 * k + 1] = "T" if corrupted[2 * k + 1] == "A" else "A"
+                    self.assertEqual(
+                        strip_and_verify_parity("".join(corrupted), k, PARITY_RULE_GC_EVEN_A_ODD_T),
+                        (sequence, [1]),
+                    )
+
     def test_strip_verify_invalid_k(self):
         with self.assertRaisesRegex(ValueError, "k_value must be a positive integer."):
             strip_and_verify_parity("AG", 0, PARITY_RULE_GC_EVEN_A_ODD_T)
@@ -1,8 +1,9 @@
 import sys
 sys.path.insert(0, 'src') # Add src directory to Python path
 
+import io
 import unittest
-from genecoder.formats import to_fasta, from_fasta # Import from_fasta
+from genecoder.formats import to_fasta, write_fasta, from_fasta # Import from_fasta
 
 class TestFastaFormatting(unittest.TestCase):
 
@@ -60,6 +61,23 @@ class TestFastaFormatting(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "line_width must be a positive integer."):
             to_fasta("ATGC", "header_lw_str", "abc") # type: ignore
 
+    # Tests for write_fasta (streams the same lines to a file object)
+    def test_write_fasta_matches_to_fasta(self):
+        for dna in ("", "ATGC", "ATGCATGCA", "ATGC" * 50):
+            for line_width in (1, 4, 8, 60):
+                with self.subTest(length=len(dna), line_width=line_width):
+                    buffer = io.StringIO()
+                    write_fasta(buffer, dna, "seq_stream", line_width)
+                    self.assertEqual(buffer.getvalue(), to_fasta(dna, "seq_stream", line_width))
+
+    def test_write_fasta_invalid_line_width_writes_nothing(self):
+        for line_width in (0, -1, 5.5):
+            with self.subTest(line_width=line_width):
+                buffer = io.StringIO()
+                with self.assertRaisesRegex(ValueError, "line_width must be a positive integer."):
+                    write_fasta(buffer, "ATGC", "header_lw_bad", line_width) # type: ignore
+                self.assertEqual(buffer.getvalue(), "")
+
 
 if __name__ == '__main__':
     unittest.main()
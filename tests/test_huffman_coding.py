@@ -2,10 +2,14 @@ import sys
 sys.path.insert(0, 'src') # Add src directory to Python path
 
 import unittest
+from unittest.mock import patch
 # collections.Counter is not directly used in these tests, but it's fundamental
 # to the huffman_coding module itself. Keep if needed for other tests, or remove if strictly not used.
 # from collections import Counter 
-from genecoder.huffman_coding import encode_huffman, decode_huffman
+from genecoder import huffman_coding
+from genecoder.huffman_coding import (
+    encode_huffman, decode_huffman, invert_huffman_table, _prepare_decoder_cached
+)
 from genecoder.error_detection import PARITY_RULE_GC_EVEN_A_ODD_T
 
 class TestHuffmanCoding(unittest.TestCase):
@@ -77,6 +81,19 @@ class TestHuffmanCoding(unittest.TestCase):
         self.assertEqual(len(dna) * 2, len(binary_str) + pad)
 
 
+    def test_encode_repeated_frequencies_returns_independent_tables(self):
+        # Inputs with equal byte frequencies share a cached codebook, but
+        # each call must return its own table.
+        dna, table, pad = encode_huffman(b"aabbc")
+        original_table = dict(table)
+        table[ord('a')] = "mutated"
+        second_dna, second_table, second_pad = encode_huffman(b"aabbc")
+        self.assertEqual((second_dna, second_table, second_pad), (dna, original_table, pad))
+        self.assertIsNot(second_table, table)
+        # Mutating the second table must not leak into a later call either.
+        second_table[ord('b')] = "mutated"
+        self.assertEqual(encode_huffman(b"aabbc"), (dna, original_table, pad))
+
     # Test Round-Trip Consistency (No Parity)
     def _assert_round_trip_no_parity(self, data_bytes, msg=None):
         # Test without parity first
@@ -114,6 +131,51 @@ class TestHuffmanCoding(unittest.TestCase):
     def test_round_trip_two_chars_need_padding(self):
         self._assert_round_trip_no_parity(b"AC")
 
+    def test_invert_huffman_table(self):
+        table = {65: '0', 66: '10', 67: '11'}
+        inverted = invert_huffman_table(table)
+        self.assertEqual(inverted, {'0': 65, '10': 66, '11': 67})
+        # Each call gets its own copy of the cached inversion.
+        self.assertIsNot(invert_huffman_table(dict(table)), inverted)
+
+    def test_mutating_inverted_table_does_not_affect_later_decodes(self):
+        data = b"mutation isolation"
+        dna, table, pad = encode_huffman(data)
+        inverted = invert_huffman_table(table)
+        inverted.clear()
+        self.assertEqual(invert_huffman_table(table), {code: byte_val for byte_val, code in table.items()})
+        self.assertEqual(decode_huffman(dna, table, pad), (data, []))
+
+    def test_decode_with_precomputed_inverted_table(self):
+        data = b"hello world"
+        dna, table, pad = encode_huffman(data)
+        inverted = invert_huffman_table(table)
+        decoded, errors = decode_huffman(dna, table, pad, inverted_table=inverted)
+        self.assertEqual(decoded, data)
+        self.assertEqual(errors, [])
+
+    def test_decoder_state_is_reused_across_calls(self):
+        data = b"decoder state cache"
+        dna, table, pad = encode_huffman(data)
+        _prepare_decoder_cached.cache_clear()
+        with patch.object(
+            huffman_coding, "_build_decode_lut", wraps=huffman_coding._build_decode_lut
+        ) as build_decode_lut:
+            self.assertEqual(decode_huffman(dna, table, pad), (data, []))
+            self.assertEqual(decode_huffman(dna, dict(table), pad), (data, []))
+        # An equal table reuses the decoder state built by the first call.
+        build_decode_lut.assert_called_once()
+
+    def test_round_trip_codes_longer_than_lookup_table(self):
+        # Doubling frequencies give a maximally skewed tree, with codes longer
+        # than the decoder's root lookup table.
+        data = b"".join(bytes([i]) * (2 ** i) for i in range(16))
+        dna, table, pad = encode_huffman(data)
+        self.assertGreater(max(len(code) for code in table.values()), 10)
+        decoded, errors = decode_huffman(dna, table, pad)
+        self.assertEqual(decoded, data)
+        self.assertEqual(errors, [])
+
     # Test decode_huffman Error Handling (No Parity Check context)
     def test_decode_invalid_dna_character(self):
         dna_no_parity, table_no_parity, pad_no_parity = encode_huffman(b"A", add_parity=False)
@@ -7,6 +7,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../s
 import unittest
 import io
 from collections import Counter
+from unittest.mock import patch
 
 from genecoder.plotting import (
     prepare_huffman_codeword_length_data,
@@ -175,6 +176,27 @@ class TestPlotting(unittest.TestCase):
             pytest.approx(1.0)
         ])
 
+    def test_calculate_windowed_gc_many_windows_with_and_without_numpy(self):
+        # Enough windows to take the NumPy path; hiding NumPy must fall back
+        # to the stdlib prefix sums with identical results.
+        dna = "ggATNNCGé" * 40
+        expected_starts = list(range(0, len(dna) - 7 + 1, 2))
+        expected_gcs = []
+        for i in expected_starts:
+            window = dna[i:i + 7].upper()
+            atcg = sum(window.count(nt) for nt in "ATCG")
+            gc = window.count("G") + window.count("C")
+            expected_gcs.append(gc / atcg if atcg else 0.0)
+
+        starts, gcs = calculate_windowed_gc_content(dna, window_size=7, step=2)
+        self.assertEqual(starts, expected_starts)
+        self.assertEqual(gcs, [pytest.approx(v) for v in expected_gcs])
+
+        with patch.dict(sys.modules, {"numpy": None}):
+            starts, gcs = calculate_windowed_gc_content(dna, window_size=7, step=2)
+        self.assertEqual(starts, expected_starts)
+        self.assertEqual(gcs, [pytest.approx(v) for v in expected_gcs])
+
     # --- Tests for identify_homopolymer_regions ---
     def test_identify_homopolymers_empty_sequence(self):
         self.assertEqual(identify_homopolymer_regions("", min_len=3), [])